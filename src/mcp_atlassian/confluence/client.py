@@ -5,7 +5,7 @@ from typing import Any
 
 from atlassian import Confluence
 
-from ..utils import configure_ssl_verification
+from ..utils import configure_connection_pool, configure_ssl_verification
 from .config import ConfluenceConfig
 
 # Configure logging
@@ -43,6 +43,9 @@ class ConfluenceClient:
                 cloud=self.config.is_cloud,
             )
 
+        # Size the connection pool for concurrent requests
+        configure_connection_pool(self.confluence._session)
+
         # Configure SSL verification using the shared utility
         configure_ssl_verification(
             service_name="Confluence",
@@ -12,12 +12,19 @@ from .client import ConfluenceClient
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Most pages a single content search request returns
+PAGE_BATCH_SIZE = 50
+
 
 class PagesMixin(ConfluenceClient):
     """Mixin for Confluence page operations."""
 
     def get_page_content(
-        self, page_id: str, *, convert_to_markdown: bool = True
+        self,
+        page_id: str,
+        *,
+        convert_to_markdown: bool = True,
+        include_ancestors: bool = False,
     ) -> ConfluencePage:
         """
         Get content of a specific page.
@@ -26,6 +33,8 @@ class PagesMixin(ConfluenceClient):
             page_id: The ID of the page to retrieve
             convert_to_markdown: When True, returns content in markdown format,
                                otherwise returns raw HTML (keyword-only)
+            include_ancestors: When True, the page's ancestors are fetched in
+                               the same request (keyword-only)
 
         Returns:
             ConfluencePage model containing the page content and metadata
@@ -35,9 +44,10 @@ class PagesMixin(ConfluenceClient):
             Exception: If there is an error retrieving the page
         """
         try:
-            page = self.confluence.get_page_by_id(
-                page_id=page_id, expand="body.storage,version,space,children.attachment"
-            )
+            expand = "body.storage,version,space,children.attachment"
+            if include_ancestors:
+                expand += ",ancestors"
+            page = self.confluence.get_page_by_id(page_id=page_id, expand=expand)
             space_key = page.get("space", {}).get("key", "")
             content = page["body"]["storage"]["value"]
             processed_html, processed_markdown = self.preprocessor.process_html_content(
@@ -439,6 +449,84 @@ class PagesMixin(ConfluenceClient):
             logger.debug("Full exception details:", exc_info=True)
             return []
 
+    def get_pages(
+        self,
+        page_ids: list[str],
+        expand: str = "version,space",
+        *,
+        convert_to_markdown: bool = True,
+    ) -> list[ConfluencePage]:
+        """
+        Get several pages by ID, fetching up to 50 pages per API request.
+
+        Args:
+            page_ids: The IDs of the pages to retrieve
+            expand: Fields to expand in the response
+            convert_to_markdown: When True, returns content in markdown format,
+                               otherwise returns raw HTML (keyword-only)
+
+        Returns:
+            List of ConfluencePage models for the pages that were found
+
+        Raises:
+            ValueError: If a page ID is not numeric
+            MCPAtlassianAuthenticationError: If authentication fails with the Confluence API (401/403)
+        """
+        invalid_ids = [page_id for page_id in page_ids if not page_id.isdigit()]
+        if invalid_ids:
+            raise ValueError(f"Invalid page IDs: {', '.join(invalid_ids)}")
+
+        page_models = []
+        try:
+            for batch_start in range(0, len(page_ids), PAGE_BATCH_SIZE):
+                batch = page_ids[batch_start : batch_start + PAGE_BATCH_SIZE]
+                response = self.confluence.get(
+                    "rest/api/content/search",
+                    params={
+                        "cql": f"id in ({','.join(batch)})",
+                        "limit": PAGE_BATCH_SIZE,
+                        "expand": expand,
+                    },
+                )
+
+                for page in (response or {}).get("results", []):
+                    # Only process content if we have "body" expanded
+                    content_override = None
+                    content = page.get("body", {}).get("storage", {}).get("value", "")
+                    if content and convert_to_markdown:
+                        space_key = page.get("space", {}).get("key", "")
+                        _, content_override = self.preprocessor.process_html_content(
+                            content, space_key=space_key
+                        )
+
+                    page_models.append(
+                        ConfluencePage.from_api_response(
+                            page,
+                            base_url=self.config.url,
+                            include_body=True,
+                            content_override=content_override,
+                            content_format="markdown"
+                            if convert_to_markdown
+                            else "storage",
+                        )
+                    )
+
+            return page_models
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code in [
+                401,
+                403,
+            ]:
+                error_msg = (
+                    f"Authentication failed for Confluence API ({http_err.response.status_code}). "
+                    "Token may be expired or invalid. Please verify credentials."
+                )
+                logger.error(error_msg)
+                raise MCPAtlassianAuthenticationError(error_msg) from http_err
+            else:
+                logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+                raise http_err
+
     def delete_page(self, page_id: str) -> bool:
         """
         Delete a Confluence page by its ID.
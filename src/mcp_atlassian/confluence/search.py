@@ -17,7 +17,11 @@ class SearchMixin(ConfluenceClient):
     """Mixin for Confluence search operations."""
 
     def search(
-        self, cql: str, limit: int = 10, spaces_filter: str | None = None
+        self,
+        cql: str,
+        limit: int = 10,
+        spaces_filter: str | None = None,
+        start: int = 0,
     ) -> list[ConfluencePage]:
         """
         Search content using Confluence Query Language (CQL).
@@ -26,6 +30,7 @@ class SearchMixin(ConfluenceClient):
             cql: Confluence Query Language string
             limit: Maximum number of results to return
             spaces_filter: Optional comma-separated list of space keys to filter by, overrides config
+            start: The starting index for pagination
 
         Returns:
             List of ConfluencePage models containing search results
@@ -62,7 +67,7 @@ class SearchMixin(ConfluenceClient):
                 logger.info(f"Applied spaces filter to query: {cql}")
 
             # Execute the CQL search query
-            results = self.confluence.cql(cql=cql, limit=limit)
+            results = self.confluence.cql(cql=cql, start=start, limit=limit)
 
             # Convert the response to a search result model
             search_result = ConfluenceSearchResult.from_api_response(
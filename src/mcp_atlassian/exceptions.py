@@ -1,4 +1,2 @@
 class MCPAtlassianAuthenticationError(Exception):
     """Raised when Atlassian API authentication fails (401/403)."""
-
-    pass
@@ -5,6 +5,7 @@ import logging
 from atlassian import Jira
 
 from mcp_atlassian.preprocessing import JiraPreprocessor
+from mcp_atlassian.utils.http import configure_connection_pool
 from mcp_atlassian.utils.ssl import configure_ssl_verification
 
 from .config import JiraConfig
@@ -45,6 +46,9 @@ class JiraClient:
                 verify_ssl=self.config.ssl_verify,
             )
 
+        # Size the connection pool for concurrent requests
+        configure_connection_pool(self.jira._session)
+
         # Configure SSL verification using the shared utility
         configure_ssl_verification(
             service_name="Jira",
@@ -3,7 +3,7 @@
 import logging
 from typing import Any
 
-from ..models import JiraIssue, JiraProject, JiraSearchResult
+from ..models import JiraProject, JiraSearchResult
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
@@ -277,7 +277,7 @@ class ProjectsMixin(JiraClient):
 
     def get_project_issues(
         self, project_key: str, start: int = 0, limit: int = 50
-    ) -> list[JiraIssue]:
+    ) -> JiraSearchResult:
         """
         Get issues for a specific project.
 
@@ -287,7 +287,8 @@ class ProjectsMixin(JiraClient):
             limit: Maximum number of issues to return
 
         Returns:
-            List of JiraIssue models representing the issues
+            JiraSearchResult with the project's issues and paging metadata; it
+            holds no issues and a total of 0 when the lookup fails
         """
         try:
             # Use JQL to get issues in the project
@@ -295,23 +296,19 @@ class ProjectsMixin(JiraClient):
 
             # Use search_issues if available (delegate to SearchMixin)
             if hasattr(self, "search_issues") and callable(self.search_issues):
-                # This assumes search_issues returns JiraIssue objects already
                 return self.search_issues(jql, start=start, limit=limit)
 
             # Fallback implementation if search_issues is not available
             result = self.jira.jql(jql=jql, fields="*all", start=start, limit=limit)
 
-            issues = []
             if isinstance(result, dict) and "issues" in result:
-                # Create a JiraSearchResult and extract the issues
-                search_result = JiraSearchResult.from_api_response(result)
-                issues = search_result.issues
+                return JiraSearchResult.from_api_response(result)
 
-            return issues
+            return JiraSearchResult(issues=[], total=0)
 
         except Exception as e:
             logger.error(f"Error getting issues for project {project_key}: {str(e)}")
-            return []
+            return JiraSearchResult(issues=[], total=0)
 
     def get_project_keys(self) -> list[str]:
         """
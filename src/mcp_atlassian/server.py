@@ -1,34 +1,145 @@
 import json
 import logging
 import os
-from collections.abc import AsyncIterator, Sequence
+import re
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, cast
+from functools import partial
+from operator import methodcaller
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
+import anyio
 from atlassian.errors import ApiError
 from mcp.server import Server
 from mcp.types import Resource, TextContent, Tool
 from pydantic import AnyUrl
 from requests.exceptions import RequestException
 
-from .confluence import ConfluenceFetcher
-from .confluence.utils import quote_cql_identifier_if_needed
-from .jira import JiraFetcher
-from .jira.utils import escape_jql_string
 from .utils.io import is_read_only_mode
 from .utils.urls import is_atlassian_cloud_url
 
+if TYPE_CHECKING:
+    # Imported lazily at runtime, only for the services that are configured
+    from .confluence import ConfluenceFetcher
+    from .jira import JiraFetcher
+    from .models.jira import JiraSearchResult
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger("mcp-atlassian")
 
+# Operators and functions that indicate a query is already written in CQL
+CQL_OPERATORS_PATTERN = re.compile(r"[=~<>]| AND | OR |currentUser\(\)")
+
+# Resource URIs have the form <service>://<path>
+RESOURCE_URI_PATTERN = re.compile(r"(confluence|jira)://(.*)", re.DOTALL)
+
+# Most results a single tool call returns
+MAX_RESULTS = 50
+
+# Issues scanned to discover the Jira projects a user is involved with
+JIRA_PROJECT_SCAN_LIMIT = 250
+JIRA_PROJECT_SCAN_PAGE_SIZE = 50
+
+# Issue fields returned by jira_get_issue and jira_search when none are requested
+JIRA_DEFAULT_FIELDS = (
+    "summary,description,status,assignee,reporter,labels,"
+    "priority,created,updated,issuetype"
+)
+
+# Issues the current user is assigned to or reported, overall and per project
+JIRA_USER_ISSUES_JQL = (
+    "assignee = {account_id} OR reporter = {account_id} ORDER BY updated DESC"
+)
+JIRA_PROJECT_USER_ISSUES_JQL = (
+    "project = {project_key} AND (assignee = {account_id} OR reporter = {account_id}) "
+    "ORDER BY updated DESC"
+)
+
+# Input descriptions shared by the Jira search tools
+JIRA_JQL_DESCRIPTION = (
+    "JQL query string (Jira Query Language). Examples:\n"
+    '- Find Epics: "issuetype = Epic AND project = PROJ"\n'
+    '- Find issues in Epic: "parent = PROJ-123"\n'
+    "- Find by status: \"status = 'In Progress' AND project = PROJ\"\n"
+    '- Find by assignee: "assignee = currentUser()"\n'
+    '- Find recently updated: "updated >= -7d AND project = PROJ"\n'
+    '- Find by label: "labels = frontend AND project = PROJ"\n'
+    '- Find by priority: "priority = High AND project = PROJ"'
+)
+JIRA_SEARCH_FIELDS_DESCRIPTION = (
+    "Comma-separated fields to return in the results. "
+    "Use '*all' for all fields, or specify individual "
+    "fields like 'summary,status,assignee,priority'"
+)
+
+# Resource descriptions, filled in per space or project
+CONFLUENCE_SPACE_DESCRIPTION = (
+    "A Confluence space containing documentation and knowledge base articles. "
+    "Space Key: {key}. {description} "
+    "Access content using: confluence://{key}/pages/PAGE_TITLE"
+)
+JIRA_PROJECT_DESCRIPTION = (
+    "A Jira project tracking issues and tasks. Project Key: {key}."
+)
+
+# Input bounds Confluence itself enforces, declared so clients can check early
+CONFLUENCE_ID_PATTERN = "^[0-9]+$"
+CONFLUENCE_TITLE_MAX_LENGTH = 255
+
+# Long input descriptions referenced from the Confluence tool schemas
+CONFLUENCE_CQL_QUERY_DESCRIPTION = (
+    "Search query - can be either a simple text (e.g. 'project documentation') or a CQL query string. Examples of CQL:\n"
+    "- Basic search: 'type=page AND space=DEV'\n"
+    "- Personal space search: 'space=\"~username\"' (note: personal space keys starting with ~ must be quoted)\n"
+    "- Search by title: 'title~\"Meeting Notes\"'\n"
+    "- Recent content: 'created >= \"2023-01-01\"'\n"
+    "- Content with specific label: 'label=documentation'\n"
+    "- Recently modified content: 'lastModified > startOfMonth(\"-1M\")'\n"
+    "- Content modified this year: 'creator = currentUser() AND lastModified > startOfYear()'\n"
+    "- Content you contributed to recently: 'contributor = currentUser() AND lastModified > startOfWeek()'\n"
+    "- Content watched by user: 'watcher = \"user@domain.com\" AND type = page'\n"
+    '- Exact phrase in content: \'text ~ "\\"Urgent Review Required\\"" AND label = "pending-approval"\'\n'
+    '- Title wildcards: \'title ~ "Minutes*" AND (space = "HR" OR space = "Marketing")\'\n'
+    'Note: Special identifiers need proper quoting in CQL: personal space keys (e.g., "~username"), reserved words, numeric IDs, and identifiers with special characters.'
+)
+CONFLUENCE_PAGE_ID_DESCRIPTION = (
+    "Confluence page ID (numeric ID, can be found in the page URL). "
+    "For example, in the URL 'https://example.atlassian.net/wiki/spaces/TEAM/pages/123456789/Page+Title', "
+    "the page ID is '123456789'"
+)
+CONFLUENCE_CONVERT_TO_MARKDOWN_DESCRIPTION = (
+    "Whether to convert page to markdown (true) or keep it in raw HTML format (false). "
+    "Raw HTML can reveal macros (like dates) not visible in markdown, "
+    "but CAUTION: using HTML significantly increases token usage in AI responses."
+)
+
+# Page ID input shared by the tools that read a single page
+CONFLUENCE_PAGE_ID_PROPERTY = {
+    "type": "string",
+    "description": CONFLUENCE_PAGE_ID_DESCRIPTION,
+    "pattern": CONFLUENCE_ID_PATTERN,
+}
+
+# Converts a fetched model into the plain dict returned by the tools
+TO_SIMPLIFIED_DICT = methodcaller("to_simplified_dict")
+
+T = TypeVar("T")
+
 
 @dataclass
 class AppContext:
     """Application context for MCP Atlassian."""
 
-    confluence: ConfluenceFetcher | None = None
-    jira: JiraFetcher | None = None
+    confluence: "ConfluenceFetcher | None" = None
+    jira: "JiraFetcher | None" = None
+    read_only: bool = False
 
 
 def get_available_services() -> dict[str, bool | None]:
@@ -41,25 +152,18 @@ def get_available_services() -> dict[str, bool | None]:
         is_cloud = is_atlassian_cloud_url(confluence_url)
 
         if is_cloud:
-            confluence_is_setup = all(
-                [
-                    confluence_url,
-                    os.getenv("CONFLUENCE_USERNAME"),
-                    os.getenv("CONFLUENCE_API_TOKEN"),
-                ]
+            confluence_is_setup = bool(
+                os.getenv("CONFLUENCE_USERNAME") and os.getenv("CONFLUENCE_API_TOKEN")
             )
             logger.info("Using Confluence Cloud authentication method")
         else:
-            confluence_is_setup = all(
-                [
-                    confluence_url,
-                    os.getenv("CONFLUENCE_PERSONAL_TOKEN")
-                    # Some on prem/data center use username and api token too.
-                    or (
-                        os.getenv("CONFLUENCE_USERNAME")
-                        and os.getenv("CONFLUENCE_API_TOKEN")
-                    ),
-                ]
+            confluence_is_setup = bool(
+                os.getenv("CONFLUENCE_PERSONAL_TOKEN")
+                # Some on prem/data center use username and api token too.
+                or (
+                    os.getenv("CONFLUENCE_USERNAME")
+                    and os.getenv("CONFLUENCE_API_TOKEN")
+                )
             )
             logger.info("Using Confluence Server/Data Center authentication method")
     else:
@@ -72,12 +176,12 @@ def get_available_services() -> dict[str, bool | None]:
         is_cloud = is_atlassian_cloud_url(jira_url)
 
         if is_cloud:
-            jira_is_setup = all(
-                [jira_url, os.getenv("JIRA_USERNAME"), os.getenv("JIRA_API_TOKEN")]
+            jira_is_setup = bool(
+                os.getenv("JIRA_USERNAME") and os.getenv("JIRA_API_TOKEN")
             )
             logger.info("Using Jira Cloud authentication method")
         else:
-            jira_is_setup = all([jira_url, os.getenv("JIRA_PERSONAL_TOKEN")])
+            jira_is_setup = bool(os.getenv("JIRA_PERSONAL_TOKEN"))
             logger.info("Using Jira Server/Data Center authentication method")
     else:
         jira_is_setup = False
@@ -92,9 +196,18 @@ async def server_lifespan(server: Server) -> AsyncIterator[AppContext]:
     services = get_available_services()
 
     try:
-        # Initialize services
-        confluence = ConfluenceFetcher() if services["confluence"] else None
-        jira = JiraFetcher() if services["jira"] else None
+        # Initialize services, importing only the ones that are configured
+        confluence = None
+        if services["confluence"]:
+            from .confluence import ConfluenceFetcher
+
+            confluence = ConfluenceFetcher()
+
+        jira = None
+        if services["jira"]:
+            from .jira import JiraFetcher
+
+            jira = JiraFetcher()
 
         # Log the startup information
         logger.info("Starting MCP Atlassian server")
@@ -111,7 +224,7 @@ async def server_lifespan(server: Server) -> AsyncIterator[AppContext]:
             logger.info(f"Jira URL: {jira_url}")
 
         # Provide context to the application
-        yield AppContext(confluence=confluence, jira=jira)
+        yield AppContext(confluence=confluence, jira=jira, read_only=read_only)
     finally:
         # Cleanup resources if needed
         pass
@@ -121,85 +234,192 @@ async def server_lifespan(server: Server) -> AsyncIterator[AppContext]:
 app = Server("mcp-atlassian", lifespan=server_lifespan)
 
 
-# Implement server handlers
-@app.list_resources()
-async def list_resources() -> list[Resource]:
-    """List Confluence spaces and Jira projects the user is actively interacting with."""
-    resources = []
+def format_json(data: Any) -> str:
+    """Serialize a tool result as compact JSON.
 
-    ctx = app.request_context.lifespan_context
+    Tool results are read by language models rather than people, so indentation
+    only adds tokens and serialization time. When orjson is installed it is used
+    as a faster drop-in encoder; otherwise the standard library is used.
 
-    # Add Confluence spaces the user has contributed to
-    if ctx and ctx.confluence:
-        try:
-            # Get spaces the user has contributed to
-            spaces = ctx.confluence.get_user_contributed_spaces(limit=250)
-
-            # Add spaces to resources
-            resources.extend(
-                [
-                    Resource(
-                        uri=f"confluence://{space['key']}",
-                        name=f"Confluence Space: {space['name']}",
-                        mimeType="text/plain",
-                        description=(
-                            f"A Confluence space containing documentation and knowledge base articles. "
-                            f"Space Key: {space['key']}. "
-                            f"{space.get('description', '')} "
-                            f"Access content using: confluence://{space['key']}/pages/PAGE_TITLE"
-                        ).strip(),
-                    )
-                    for space in spaces.values()
-                ]
+    Args:
+        data: The JSON-serializable result
+
+    Returns:
+        The JSON document, with non-ASCII characters left unescaped
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def parse_json(value: str) -> Any:
+    """Parse a JSON tool argument, using orjson when it is installed.
+
+    Args:
+        value: The JSON text supplied by the client
+
+    Returns:
+        The decoded value
+
+    Raises:
+        json.JSONDecodeError: If the value is not valid JSON (orjson's error is
+            a subclass of it)
+    """
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+async def run_concurrently(*calls: Callable[[], Awaitable[T]]) -> list[T]:
+    """Run async calls concurrently.
+
+    Args:
+        calls: Zero-argument async callables, typically coroutines bound with partial
+
+    Returns:
+        The results of the calls, in the order the calls were given
+    """
+    results: list[Any] = [None] * len(calls)
+
+    async def run(index: int, call: Callable[[], Awaitable[T]]) -> None:
+        results[index] = await call()
+
+    async with anyio.create_task_group() as task_group:
+        for index, call in enumerate(calls):
+            task_group.start_soon(run, index, call)
+
+    return results
+
+
+async def run_in_threads(*calls: Callable[[], T]) -> list[T]:
+    """Run blocking calls concurrently in worker threads.
+
+    Args:
+        calls: Zero-argument callables, typically fetcher methods bound with partial
+
+    Returns:
+        The results of the calls, in the order the calls were given
+    """
+    return await run_concurrently(
+        *(partial(anyio.to_thread.run_sync, call) for call in calls)
+    )
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking fetcher call in a worker thread.
+
+    Fetchers use requests, so calling them directly would block the event loop
+    and serialize concurrent tool calls.
+
+    Args:
+        func: The blocking function to call
+        args: Positional arguments for the function
+        kwargs: Keyword arguments for the function
+
+    Returns:
+        The result of the call
+    """
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs))
+
+
+async def get_confluence_space_resources(
+    confluence: "ConfluenceFetcher",
+) -> list[Resource]:
+    """List the Confluence spaces the user has contributed to as resources."""
+    try:
+        # Get spaces the user has contributed to
+        spaces = await run_blocking(confluence.get_user_contributed_spaces, limit=250)
+
+        return [
+            Resource(
+                uri=f"confluence://{space['key']}",
+                name=f"Confluence Space: {space['name']}",
+                mimeType="text/plain",
+                description=CONFLUENCE_SPACE_DESCRIPTION.format_map(
+                    defaultdict(str, space)
+                ),
             )
-        except Exception as e:
-            logger.error(f"Error fetching Confluence spaces: {str(e)}")
+            for space in spaces.values()
+        ]
+    except Exception as e:
+        logger.error(f"Error fetching Confluence spaces: {str(e)}")
+        return []
 
-    # Add Jira projects the user is involved with
-    if ctx and ctx.jira:
-        try:
-            # Get current user's account ID
-            account_id = ctx.jira.get_current_user_account_id()
 
-            # Escape the account ID for safe JQL insertion
-            escaped_account_id = escape_jql_string(account_id)
+async def get_jira_project_resources(jira: "JiraFetcher") -> list[Resource]:
+    """List the Jira projects the user is involved with as resources."""
+    from .jira.utils import escape_jql_string
+
+    try:
+        # Get current user's account ID
+        account_id = await run_blocking(jira.get_current_user_account_id)
 
-            # Use JQL to find issues the user is assigned to or reported, using the escaped ID
-            # Note: We use the escaped_account_id directly, as it already includes the necessary quotes.
-            jql = f"assignee = {escaped_account_id} OR reporter = {escaped_account_id} ORDER BY updated DESC"
-            logger.debug(f"Executing JQL for list_resources: {jql}")
-            issues = ctx.jira.jira.jql(jql, limit=250, fields=["project"])
+        # Use JQL to find issues the user is assigned to or reported, with the
+        # account ID escaped and quoted for safe JQL insertion
+        jql = JIRA_USER_ISSUES_JQL.format(account_id=escape_jql_string(account_id))
+        logger.debug(f"Executing JQL for list_resources: {jql}")
 
-            # Extract and deduplicate projects
-            projects = {}
-            for issue in issues.get("issues", []):
-                project = issue.get("fields", {}).get("project", {})
-                project_key = project.get("key")
-                if project_key and project_key not in projects:
-                    projects[project_key] = {
-                        "key": project_key,
-                        "name": project.get("name", project_key),
-                        "description": project.get("description", ""),
-                    }
+        # Fetch the first page to learn the total, then the remaining pages concurrently
+        search_page = partial(
+            jira.jira.jql, jql, limit=JIRA_PROJECT_SCAN_PAGE_SIZE, fields=["project"]
+        )
+        first_page = await run_blocking(search_page, start=0)
+        total = min(first_page.get("total", 0), JIRA_PROJECT_SCAN_LIMIT)
+        other_pages = await run_in_threads(
+            *(
+                partial(search_page, start=start)
+                for start in range(
+                    JIRA_PROJECT_SCAN_PAGE_SIZE, total, JIRA_PROJECT_SCAN_PAGE_SIZE
+                )
+            )
+        )
 
-            # Add projects to resources
-            resources.extend(
-                [
-                    Resource(
-                        uri=f"jira://{project['key']}",
-                        name=f"Jira Project: {project['name']}",
-                        mimeType="text/plain",
-                        description=(
-                            f"A Jira project tracking issues and tasks. Project Key: {project['key']}. "
-                        ).strip(),
+        # Extract and deduplicate projects, keeping the order they were found in
+        seen_keys: set[str] = set()
+        projects = []
+        for page in (first_page, *other_pages):
+            for issue in page.get("issues", []):
+                project = (issue.get("fields") or {}).get("project") or {}
+                project_key = project.get("key")
+                if project_key and project_key not in seen_keys:
+                    seen_keys.add(project_key)
+                    projects.append(
+                        {
+                            "key": project_key,
+                            "name": project.get("name", project_key),
+                            "description": project.get("description", ""),
+                        }
                     )
-                    for project in projects.values()
-                ]
+
+        return [
+            Resource(
+                uri=f"jira://{project['key']}",
+                name=f"Jira Project: {project['name']}",
+                mimeType="text/plain",
+                description=JIRA_PROJECT_DESCRIPTION.format_map(project),
             )
-        except Exception as e:
-            logger.error(f"Error fetching Jira projects: {e}", exc_info=True)
+            for project in projects
+        ]
+    except Exception as e:
+        logger.error(f"Error fetching Jira projects: {e}", exc_info=True)
+        return []
+
+
+# Implement server handlers
+@app.list_resources()
+async def list_resources() -> list[Resource]:
+    """List Confluence spaces and Jira projects the user is actively interacting with."""
+    ctx = app.request_context.lifespan_context
 
-    return resources
+    # The services are independent, so query them concurrently
+    fetches = []
+    if ctx and ctx.confluence:
+        fetches.append(partial(get_confluence_space_resources, ctx.confluence))
+    if ctx and ctx.jira:
+        fetches.append(partial(get_jira_project_resources, ctx.jira))
+
+    results = await run_concurrently(*fetches)
+    return [resource for service_resources in results for resource in service_resources]
 
 
 @app.read_resource()
@@ -209,28 +429,36 @@ async def read_resource(uri: AnyUrl) -> str:
     # Get application context
     ctx = app.request_context.lifespan_context
 
+    # Split the URI into its service scheme and path in a single pass
+    uri_match = RESOURCE_URI_PATTERN.match(str(uri))
+    scheme, path = uri_match.groups() if uri_match else (None, "")
+
     # Handle Confluence resources
-    if str(uri).startswith("confluence://"):
+    if scheme == "confluence":
         if not ctx or not ctx.confluence:
             raise ValueError(
                 "Confluence is not configured. Please provide Confluence credentials."
             )
-        parts = str(uri).replace("confluence://", "").split("/")
+        parts = path.split("/", 2)
 
         # Handle space listing
         if len(parts) == 1:
             space_key = parts[0]
 
+            from .confluence.utils import quote_cql_identifier_if_needed
+
             # Apply the fix here - properly quote the space key
             quoted_space_key = quote_cql_identifier_if_needed(space_key)
 
             # Use CQL to find recently updated pages in this space
             cql = f"space = {quoted_space_key} AND contributor = currentUser() ORDER BY lastmodified DESC"
-            pages = ctx.confluence.search(cql=cql, limit=20)
+            pages = await run_blocking(ctx.confluence.search, cql=cql, limit=20)
 
             if not pages:
                 # Fallback to regular space pages if no user-contributed pages found
-                pages = ctx.confluence.get_space_pages(space_key, limit=10)
+                pages = await run_blocking(
+                    ctx.confluence.get_space_pages, space_key, limit=10
+                )
 
             content = []
             for page in pages:
@@ -246,7 +474,9 @@ async def read_resource(uri: AnyUrl) -> str:
         elif len(parts) >= 3 and parts[1] == "pages":
             space_key = parts[0]
             title = parts[2]
-            page = ctx.confluence.get_page_by_title(space_key, title)
+            page = await run_blocking(
+                ctx.confluence.get_page_by_title, space_key, title
+            )
 
             if not page:
                 raise ValueError(f"Page not found: {title}")
@@ -254,25 +484,36 @@ async def read_resource(uri: AnyUrl) -> str:
             return page.page_content
 
     # Handle Jira resources
-    elif str(uri).startswith("jira://"):
+    elif scheme == "jira":
         if not ctx or not ctx.jira:
             raise ValueError("Jira is not configured. Please provide Jira credentials.")
-        parts = str(uri).replace("jira://", "").split("/")
+        parts = path.split("/", 2)
 
         # Handle project listing
         if len(parts) == 1:
             project_key = parts[0]
 
             # Get current user's account ID
-            account_id = ctx.jira.get_current_user_account_id()
+            account_id = await run_blocking(ctx.jira.get_current_user_account_id)
+
+            from .jira.utils import escape_jql_string
 
             # Use JQL to find issues in this project that the user is involved with
-            jql = f"project = {project_key} AND (assignee = {account_id} OR reporter = {account_id}) ORDER BY updated DESC"
-            issues = ctx.jira.search_issues(jql=jql, limit=20)
+            jql = JIRA_PROJECT_USER_ISSUES_JQL.format(
+                project_key=escape_jql_string(project_key),
+                account_id=escape_jql_string(account_id),
+            )
+            search_result = await run_blocking(
+                ctx.jira.search_issues, jql=jql, limit=20
+            )
+            issues = search_result.issues
 
             if not issues:
                 # Fallback to recent issues if no user-related issues found
-                issues = ctx.jira.get_project_issues(project_key, limit=10)
+                project_issues = await run_blocking(
+                    ctx.jira.get_project_issues, project_key, limit=10
+                )
+                issues = project_issues.issues
 
             content = []
             for issue in issues:
@@ -284,1901 +525,2111 @@ async def read_resource(uri: AnyUrl) -> str:
                 status_name = status.get("name", "Unknown") if status else "Unknown"
 
                 # Create a markdown representation of the issue
-                issue_content = (
+                issue_parts = [
                     f"# [{key}: {summary}]({url})\nStatus: {status_name}\n\n"
-                )
-                if issue_dict.get("description"):
-                    issue_content += f"{issue_dict.get('description')}\n\n"
+                ]
+                description = issue_dict.get("description")
+                if description:
+                    issue_parts.append(f"{description}\n\n")
+                issue_parts.append("---")
 
-                content.append(f"{issue_content}---")
+                content.append("".join(issue_parts))
 
             return "\n\n".join(content)
 
         # Handle specific issue
         elif len(parts) >= 2:
             issue_key = parts[1] if len(parts) > 1 else parts[0]
-            issue = ctx.jira.get_issue(issue_key)
+            issue = await run_blocking(ctx.jira.get_issue, issue_key)
 
             if not issue:
                 raise ValueError(f"Issue not found: {issue_key}")
 
             issue_dict = issue.to_simplified_dict()
-            markdown = f"# {issue_dict.get('key')}: {issue_dict.get('summary')}\n\n"
+            markdown = [f"# {issue_dict.get('key')}: {issue_dict.get('summary')}\n\n"]
 
-            if issue_dict.get("status"):
-                status_name = issue_dict.get("status", {}).get("name", "Unknown")
-                markdown += f"**Status:** {status_name}\n\n"
+            status = issue_dict.get("status")
+            if status:
+                markdown.append(f"**Status:** {status.get('name', 'Unknown')}\n\n")
 
-            if issue_dict.get("description"):
-                markdown += f"{issue_dict.get('description')}\n\n"
+            description = issue_dict.get("description")
+            if description:
+                markdown.append(f"{description}\n\n")
 
-            return markdown
+            return "".join(markdown)
 
     raise ValueError(f"Invalid resource URI: {uri}")
 
 
+# Confluence tools that only read data
+CONFLUENCE_READ_TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="confluence_search",
+        description="Search Confluence content using simple terms or CQL",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": CONFLUENCE_CQL_QUERY_DESCRIPTION,
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of results (1-50)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+                "spaces_filter": {
+                    "type": "string",
+                    "description": "Comma-separated list of space keys to filter results by. Overrides the environment variable CONFLUENCE_SPACES_FILTER if provided.",
+                },
+                "start": {
+                    "type": "number",
+                    "description": "Starting index for pagination (0-based)",
+                    "default": 0,
+                    "minimum": 0,
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="confluence_get_page",
+        description="Get content of a specific Confluence page by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "page_id": CONFLUENCE_PAGE_ID_PROPERTY,
+                "include_metadata": {
+                    "type": "boolean",
+                    "description": "Whether to include page metadata such as creation date, last update, version, and labels",
+                    "default": True,
+                },
+                "convert_to_markdown": {
+                    "type": "boolean",
+                    "description": CONFLUENCE_CONVERT_TO_MARKDOWN_DESCRIPTION,
+                    "default": True,
+                },
+                "include_ancestors": {
+                    "type": "boolean",
+                    "description": "Whether to include the page's ancestors (parent pages) in the response, saving a separate confluence_get_page_ancestors call",
+                    "default": False,
+                },
+            },
+            "required": ["page_id"],
+        },
+    ),
+    Tool(
+        name="confluence_get_pages",
+        description="Get several Confluence pages by ID in a single request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "page_ids": {
+                    "type": "array",
+                    "items": {"type": "string", "pattern": CONFLUENCE_ID_PATTERN},
+                    "description": "Confluence page IDs (numeric IDs, can be found in the page URLs)",
+                    "minItems": 1,
+                    "maxItems": 50,
+                },
+                "include_content": {
+                    "type": "boolean",
+                    "description": "Whether to include the page content in the response",
+                    "default": False,
+                },
+                "convert_to_markdown": {
+                    "type": "boolean",
+                    "description": CONFLUENCE_CONVERT_TO_MARKDOWN_DESCRIPTION,
+                    "default": True,
+                },
+            },
+            "required": ["page_ids"],
+        },
+    ),
+    Tool(
+        name="confluence_get_page_children",
+        description="Get child pages of a specific Confluence page",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "parent_id": {
+                    "type": "string",
+                    "pattern": CONFLUENCE_ID_PATTERN,
+                    "description": "The ID of the parent page whose children you want to retrieve",
+                },
+                "expand": {
+                    "type": "string",
+                    "description": "Fields to expand in the response (e.g., 'version', 'body.storage')",
+                    "default": "version",
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of child pages to return (1-50)",
+                    "default": 25,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+                "include_content": {
+                    "type": "boolean",
+                    "description": "Whether to include the page content in the response",
+                    "default": False,
+                },
+                "start": {
+                    "type": "number",
+                    "description": "Starting index for pagination (0-based)",
+                    "default": 0,
+                    "minimum": 0,
+                },
+            },
+            "required": ["parent_id"],
+        },
+    ),
+    Tool(
+        name="confluence_get_page_ancestors",
+        description="Get ancestor (parent) pages of a specific Confluence page",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "page_id": {
+                    "type": "string",
+                    "pattern": CONFLUENCE_ID_PATTERN,
+                    "description": "The ID of the page whose ancestors you want to retrieve",
+                },
+            },
+            "required": ["page_id"],
+        },
+    ),
+    Tool(
+        name="confluence_get_comments",
+        description="Get comments for a specific Confluence page",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "page_id": CONFLUENCE_PAGE_ID_PROPERTY,
+            },
+            "required": ["page_id"],
+        },
+    ),
+)
+
+
+# Confluence tools that create, update or delete content
+CONFLUENCE_WRITE_TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="confluence_create_page",
+        description="Create a new Confluence page",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "space_key": {
+                    "type": "string",
+                    "description": "The key of the space to create the page in "
+                    "(usually a short uppercase code like 'DEV', 'TEAM', or 'DOC')",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "The title of the page",
+                    "maxLength": CONFLUENCE_TITLE_MAX_LENGTH,
+                },
+                "content": {
+                    "type": "string",
+                    "description": "The content of the page in Markdown format. "
+                    "Supports headings, lists, tables, code blocks, and other "
+                    "Markdown syntax",
+                },
+                "parent_id": {
+                    "type": "string",
+                    "pattern": CONFLUENCE_ID_PATTERN,
+                    "description": "Optional parent page ID. If provided, this page "
+                    "will be created as a child of the specified page",
+                },
+            },
+            "required": ["space_key", "title", "content"],
+        },
+    ),
+    Tool(
+        name="confluence_update_page",
+        description="Update an existing Confluence page",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "page_id": {
+                    "type": "string",
+                    "pattern": CONFLUENCE_ID_PATTERN,
+                    "description": "The ID of the page to update",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "The new title of the page",
+                    "maxLength": CONFLUENCE_TITLE_MAX_LENGTH,
+                },
+                "content": {
+                    "type": "string",
+                    "description": "The new content of the page in Markdown format",
+                },
+                "is_minor_edit": {
+                    "type": "boolean",
+                    "description": "Whether this is a minor edit",
+                    "default": False,
+                },
+                "version_comment": {
+                    "type": "string",
+                    "description": "Optional comment for this version",
+                    "default": "",
+                },
+            },
+            "required": ["page_id", "title", "content"],
+        },
+    ),
+    Tool(
+        name="confluence_delete_page",
+        description="Delete an existing Confluence page",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "page_id": {
+                    "type": "string",
+                    "pattern": CONFLUENCE_ID_PATTERN,
+                    "description": "The ID of the page to delete",
+                },
+            },
+            "required": ["page_id"],
+        },
+    ),
+    Tool(
+        name="confluence_attach_content",
+        description="Attach content to a Confluence page",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {
+                    "type": "string",
+                    "format": "binary",
+                    "description": "The content to attach (bytes)",
+                },
+                "name": {
+                    "type": "string",
+                    "description": "The name of the attachment",
+                },
+                "page_id": {
+                    "type": "string",
+                    "pattern": CONFLUENCE_ID_PATTERN,
+                    "description": "The ID of the page to attach the content to",
+                },
+            },
+            "required": ["content", "name", "page_id"],
+        },
+    ),
+)
+
+
+# Jira tools that only read data
+JIRA_READ_TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="jira_get_issue",
+        description="Get details of a specific Jira issue including its Epic links and relationship information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Jira issue key (e.g., 'PROJ-123')",
+                },
+                "fields": {
+                    "type": "string",
+                    "description": "Fields to return. Can be a comma-separated list (e.g., 'summary,status,customfield_10010'), '*all' for all fields (including custom fields), or omitted for essential fields only",
+                    "default": JIRA_DEFAULT_FIELDS,
+                },
+                "expand": {
+                    "type": "string",
+                    "description": (
+                        "Optional fields to expand. Examples: 'renderedFields' "
+                        "(for rendered content), 'transitions' (for available "
+                        "status transitions), 'changelog' (for history)"
+                    ),
+                    "default": None,
+                },
+                "comment_limit": {
+                    "type": "integer",
+                    "description": (
+                        "Maximum number of comments to include "
+                        "(0 or null for no comments)"
+                    ),
+                    "minimum": 0,
+                    "maximum": 100,
+                    "default": 10,
+                },
+                "properties": {
+                    "type": "string",
+                    "description": "A comma-separated list of issue properties to return",
+                    "default": None,
+                },
+                "update_history": {
+                    "type": "boolean",
+                    "description": "Whether to update the issue view history for the requesting user",
+                    "default": True,
+                },
+            },
+            "required": ["issue_key"],
+        },
+    ),
+    Tool(
+        name="jira_search",
+        description="Search Jira issues using JQL (Jira Query Language)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jql": {
+                    "type": "string",
+                    "description": JIRA_JQL_DESCRIPTION,
+                },
+                "fields": {
+                    "type": "string",
+                    "description": JIRA_SEARCH_FIELDS_DESCRIPTION,
+                    "default": JIRA_DEFAULT_FIELDS,
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of results (1-50)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+                "startAt": {
+                    "type": "number",
+                    "description": "Starting index for pagination (0-based)",
+                    "default": 0,
+                    "minimum": 0,
+                },
+                "projects_filter": {
+                    "type": "string",
+                    "description": "Comma-separated list of project keys to filter results by. Overrides the environment variable JIRA_PROJECTS_FILTER if provided.",
+                },
+            },
+            "required": ["jql"],
+        },
+    ),
+    Tool(
+        name="jira_get_project_issues",
+        description="Get all issues for a specific Jira project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_key": {
+                    "type": "string",
+                    "description": "The project key",
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of results (1-50)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+                "startAt": {
+                    "type": "number",
+                    "description": "Starting index for pagination (0-based)",
+                    "default": 0,
+                    "minimum": 0,
+                },
+            },
+            "required": ["project_key"],
+        },
+    ),
+    Tool(
+        name="jira_get_epic_issues",
+        description="Get all issues linked to a specific epic",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "epic_key": {
+                    "type": "string",
+                    "description": "The key of the epic (e.g., 'PROJ-123')",
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of issues to return (1-50)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+                "startAt": {
+                    "type": "number",
+                    "description": "Starting index for pagination (0-based)",
+                    "default": 0,
+                    "minimum": 0,
+                },
+            },
+            "required": ["epic_key"],
+        },
+    ),
+    Tool(
+        name="jira_get_transitions",
+        description="Get available status transitions for a Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Jira issue key (e.g., 'PROJ-123')",
+                },
+            },
+            "required": ["issue_key"],
+        },
+    ),
+    Tool(
+        name="jira_get_worklog",
+        description="Get worklog entries for a Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Jira issue key (e.g., 'PROJ-123')",
+                },
+            },
+            "required": ["issue_key"],
+        },
+    ),
+    Tool(
+        name="jira_download_attachments",
+        description="Download attachments from a Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Jira issue key (e.g., 'PROJ-123')",
+                },
+                "target_dir": {
+                    "type": "string",
+                    "description": "Directory where attachments should be saved",
+                },
+            },
+            "required": ["issue_key", "target_dir"],
+        },
+    ),
+    Tool(
+        name="jira_get_agile_boards",
+        description="Get jira agile boards by name, project key, or type",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_name": {
+                    "type": "string",
+                    "description": "The name of board, support fuzzy search",
+                },
+                "project_key": {
+                    "type": "string",
+                    "description": "Jira project key (e.g., 'PROJ-123')",
+                },
+                "board_type": {
+                    "type": "string",
+                    "description": "The type of jira board (e.g., 'scrum', 'kanban')",
+                },
+                "startAt": {
+                    "type": "number",
+                    "description": "Starting index for pagination (0-based)",
+                    "default": 0,
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of results (1-50)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+            },
+        },
+    ),
+    Tool(
+        name="jira_get_board_issues",
+        description="Get all issues linked to a specific board",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The id of the board (e.g., '1001')",
+                },
+                "jql": {
+                    "type": "string",
+                    "description": JIRA_JQL_DESCRIPTION,
+                },
+                "fields": {
+                    "type": "string",
+                    "description": JIRA_SEARCH_FIELDS_DESCRIPTION,
+                    "default": "*all",
+                },
+                "startAt": {
+                    "type": "number",
+                    "description": "Starting index for pagination (0-based)",
+                    "default": 0,
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of results (1-50)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+                "expand": {
+                    "type": "string",
+                    "description": "Fields to expand in the response (e.g., 'version', 'body.storage')",
+                    "default": "version",
+                },
+            },
+            "required": ["board_id", "jql"],
+        },
+    ),
+    Tool(
+        name="jira_get_sprints_from_board",
+        description="Get jira sprints from board by state",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The id of board (e.g., '1000')",
+                },
+                "state": {
+                    "type": "string",
+                    "description": "Sprint state (e.g., 'active', 'future', 'closed')",
+                },
+                "startAt": {
+                    "type": "number",
+                    "description": "Starting index for pagination (0-based)",
+                    "default": 0,
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of results (1-50)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+            },
+        },
+    ),
+    Tool(
+        name="jira_get_sprint_issues",
+        description="Get jira issues from sprint",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sprint_id": {
+                    "type": "string",
+                    "description": "The id of sprint (e.g., '10001')",
+                },
+                "fields": {
+                    "type": "string",
+                    "description": JIRA_SEARCH_FIELDS_DESCRIPTION,
+                    "default": "*all",
+                },
+                "startAt": {
+                    "type": "number",
+                    "description": "Starting index for pagination (0-based)",
+                    "default": 0,
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Maximum number of results (1-50)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+            },
+            "required": ["sprint_id"],
+        },
+    ),
+)
+
+
+# Jira tools that create, update or delete issues
+JIRA_WRITE_TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="jira_create_issue",
+        description="Create a new Jira issue with optional Epic link or parent for subtasks",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_key": {
+                    "type": "string",
+                    "description": (
+                        "The JIRA project key (e.g. 'PROJ', 'DEV', 'SUPPORT'). "
+                        "This is the prefix of issue keys in your project. "
+                        "Never assume what it might be, always ask the user."
+                    ),
+                },
+                "summary": {
+                    "type": "string",
+                    "description": "Summary/title of the issue",
+                },
+                "issue_type": {
+                    "type": "string",
+                    "description": (
+                        "Issue type (e.g. 'Task', 'Bug', 'Story', 'Epic', 'Subtask'). "
+                        "The available types depend on your project configuration. "
+                        "For subtasks, use 'Subtask' (not 'Sub-task') and include parent in additional_fields."
+                    ),
+                },
+                "assignee": {
+                    "type": "string",
+                    "description": "Assignee of the ticket (accountID, full name or e-mail)",
+                    "default": None,
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Issue description",
+                    "default": "",
+                },
+                "components": {
+                    "type": "string",
+                    "description": "Comma-separated list of component names to assign (e.g., 'Frontend,API')",
+                    "default": "",
+                },
+                "additional_fields": {
+                    "type": "string",
+                    "description": (
+                        "Optional JSON string of additional fields to set. "
+                        "Examples:\n"
+                        '- Set priority: {"priority": {"name": "High"}}\n'
+                        '- Add labels: {"labels": ["frontend", "urgent"]}\n'
+                        '- Link to parent (for any issue type): {"parent": "PROJ-123"}\n'
+                        '- Set Fix Version/s: {"fixVersions": [{"id": "10020"}]}\n'
+                        '- Custom fields: {"customfield_10010": "value"}'
+                    ),
+                    "default": "{}",
+                },
+            },
+            "required": ["project_key", "summary", "issue_type"],
+        },
+    ),
+    Tool(
+        name="jira_update_issue",
+        description="Update an existing Jira issue including changing status, adding Epic links, updating fields, etc.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Jira issue key (e.g., 'PROJ-123')",
+                },
+                "fields": {
+                    "type": "string",
+                    "description": (
+                        "A valid JSON object of fields to update as a string. "
+                        'Example: \'{"summary": "New title", "description": "Updated description", '
+                        '"priority": {"name": "High"}, "assignee": {"name": "john.doe"}}\''
+                    ),
+                },
+                "additional_fields": {
+                    "type": "string",
+                    "description": "Optional JSON string of additional fields to update. Use this for custom fields or more complex updates.",
+                    "default": "{}",
+                },
+                "attachments": {
+                    "type": "string",
+                    "description": "Optional JSON string or comma-separated list of file paths to attach to the issue. "
+                    'Example: "/path/to/file1.txt,/path/to/file2.txt" or "["/path/to/file1.txt","/path/to/file2.txt"]"',
+                },
+            },
+            "required": ["issue_key", "fields"],
+        },
+    ),
+    Tool(
+        name="jira_delete_issue",
+        description="Delete an existing Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Jira issue key (e.g. PROJ-123)",
+                },
+            },
+            "required": ["issue_key"],
+        },
+    ),
+    Tool(
+        name="jira_add_comment",
+        description="Add a comment to a Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Jira issue key (e.g., 'PROJ-123')",
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Comment text in Markdown format",
+                },
+            },
+            "required": ["issue_key", "comment"],
+        },
+    ),
+    Tool(
+        name="jira_add_worklog",
+        description="Add a worklog entry to a Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Jira issue key (e.g., 'PROJ-123')",
+                },
+                "time_spent": {
+                    "type": "string",
+                    "description": (
+                        "Time spent in Jira format. Examples: "
+                        "'1h 30m' (1 hour and 30 minutes), "
+                        "'1d' (1 day), '30m' (30 minutes), "
+                        "'4h' (4 hours)"
+                    ),
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Optional comment for the worklog in Markdown format",
+                },
+                "started": {
+                    "type": "string",
+                    "description": (
+                        "Optional start time in ISO format. "
+                        "If not provided, the current time will be used. "
+                        "Example: '2023-08-01T12:00:00.000+0000'"
+                    ),
+                },
+            },
+            "required": ["issue_key", "time_spent"],
+        },
+    ),
+    Tool(
+        name="jira_link_to_epic",
+        description="Link an existing issue to an epic",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The key of the issue to link (e.g., 'PROJ-123')",
+                },
+                "epic_key": {
+                    "type": "string",
+                    "description": "The key of the epic to link to (e.g., 'PROJ-456')",
+                },
+            },
+            "required": ["issue_key", "epic_key"],
+        },
+    ),
+    Tool(
+        name="jira_transition_issue",
+        description="Transition a Jira issue to a new status",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "Jira issue key (e.g., 'PROJ-123')",
+                },
+                "transition_id": {
+                    "type": "string",
+                    "description": (
+                        "ID of the transition to perform. Use the jira_get_transitions tool first "
+                        "to get the available transition IDs for the issue. "
+                        "Example values: '11', '21', '31'"
+                    ),
+                },
+                "fields": {
+                    "type": "string",
+                    "description": (
+                        "JSON string of fields to update during the transition. "
+                        "Some transitions require specific fields to be set. "
+                        'Example: \'{"resolution": {"name": "Fixed"}}\''
+                    ),
+                    "default": "{}",
+                },
+                "comment": {
+                    "type": "string",
+                    "description": (
+                        "Comment to add during the transition (optional). "
+                        "This will be visible in the issue history."
+                    ),
+                },
+            },
+            "required": ["issue_key", "transition_id"],
+        },
+    ),
+)
+
+# Arguments each tool requires, taken from its input schema
+REQUIRED_ARGUMENTS: dict[str, tuple[str, ...]] = {
+    tool.name: tuple(tool.inputSchema.get("required", ()))
+    for tool in (
+        *CONFLUENCE_READ_TOOLS,
+        *CONFLUENCE_WRITE_TOOLS,
+        *JIRA_READ_TOOLS,
+        *JIRA_WRITE_TOOLS,
+    )
+}
+
+
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """List available Confluence and Jira tools."""
     tools = []
     ctx = app.request_context.lifespan_context
 
-    # Check if we're in read-only mode
-    read_only = is_read_only_mode()
+    # Read-only mode is resolved once at startup
+    read_only = ctx.read_only if ctx else False
 
     # Add Confluence tools if Confluence is configured
     if ctx and ctx.confluence:
         # Always add read operations
-        tools.extend(
-            [
-                Tool(
-                    name="confluence_search",
-                    description="Search Confluence content using simple terms or CQL",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Search query - can be either a simple text (e.g. 'project documentation') or a CQL query string. Examples of CQL:\n"
-                                "- Basic search: 'type=page AND space=DEV'\n"
-                                "- Personal space search: 'space=\"~username\"' (note: personal space keys starting with ~ must be quoted)\n"
-                                "- Search by title: 'title~\"Meeting Notes\"'\n"
-                                "- Recent content: 'created >= \"2023-01-01\"'\n"
-                                "- Content with specific label: 'label=documentation'\n"
-                                "- Recently modified content: 'lastModified > startOfMonth(\"-1M\")'\n"
-                                "- Content modified this year: 'creator = currentUser() AND lastModified > startOfYear()'\n"
-                                "- Content you contributed to recently: 'contributor = currentUser() AND lastModified > startOfWeek()'\n"
-                                "- Content watched by user: 'watcher = \"user@domain.com\" AND type = page'\n"
-                                '- Exact phrase in content: \'text ~ "\\"Urgent Review Required\\"" AND label = "pending-approval"\'\n'
-                                '- Title wildcards: \'title ~ "Minutes*" AND (space = "HR" OR space = "Marketing")\'\n'
-                                'Note: Special identifiers need proper quoting in CQL: personal space keys (e.g., "~username"), reserved words, numeric IDs, and identifiers with special characters.',
-                            },
-                            "limit": {
-                                "type": "number",
-                                "description": "Maximum number of results (1-50)",
-                                "default": 10,
-                                "minimum": 1,
-                                "maximum": 50,
-                            },
-                            "spaces_filter": {
-                                "type": "string",
-                                "description": "Comma-separated list of space keys to filter results by. Overrides the environment variable CONFLUENCE_SPACES_FILTER if provided.",
-                            },
-                        },
-                        "required": ["query"],
-                    },
-                ),
-                Tool(
-                    name="confluence_get_page",
-                    description="Get content of a specific Confluence page by ID",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "page_id": {
-                                "type": "string",
-                                "description": "Confluence page ID (numeric ID, can be found in the page URL). "
-                                "For example, in the URL 'https://example.atlassian.net/wiki/spaces/TEAM/pages/123456789/Page+Title', "
-                                "the page ID is '123456789'",
-                            },
-                            "include_metadata": {
-                                "type": "boolean",
-                                "description": "Whether to include page metadata such as creation date, last update, version, and labels",
-                                "default": True,
-                            },
-                            "convert_to_markdown": {
-                                "type": "boolean",
-                                "description": "Whether to convert page to markdown (true) or keep it in raw HTML format (false). Raw HTML can reveal macros (like dates) not visible in markdown, but CAUTION: using HTML significantly increases token usage in AI responses.",
-                                "default": True,
-                            },
-                        },
-                        "required": ["page_id"],
-                    },
-                ),
-                Tool(
-                    name="confluence_get_page_children",
-                    description="Get child pages of a specific Confluence page",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "parent_id": {
-                                "type": "string",
-                                "description": "The ID of the parent page whose children you want to retrieve",
-                            },
-                            "expand": {
-                                "type": "string",
-                                "description": "Fields to expand in the response (e.g., 'version', 'body.storage')",
-                                "default": "version",
-                            },
-                            "limit": {
-                                "type": "number",
-                                "description": "Maximum number of child pages to return (1-50)",
-                                "default": 25,
-                                "minimum": 1,
-                                "maximum": 50,
-                            },
-                            "include_content": {
-                                "type": "boolean",
-                                "description": "Whether to include the page content in the response",
-                                "default": False,
-                            },
-                        },
-                        "required": ["parent_id"],
-                    },
-                ),
-                Tool(
-                    name="confluence_get_page_ancestors",
-                    description="Get ancestor (parent) pages of a specific Confluence page",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "page_id": {
-                                "type": "string",
-                                "description": "The ID of the page whose ancestors you want to retrieve",
-                            },
-                        },
-                        "required": ["page_id"],
-                    },
-                ),
-                Tool(
-                    name="confluence_get_comments",
-                    description="Get comments for a specific Confluence page",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "page_id": {
-                                "type": "string",
-                                "description": "Confluence page ID (numeric ID, can be parsed from URL, "
-                                "e.g. from 'https://example.atlassian.net/wiki/spaces/TEAM/pages/123456789/Page+Title' "
-                                "-> '123456789')",
-                            }
-                        },
-                        "required": ["page_id"],
-                    },
-                ),
-            ]
-        )
+        tools.extend(CONFLUENCE_READ_TOOLS)
 
         # Only add write operations if not in read-only mode
         if not read_only:
-            tools.extend(
-                [
-                    Tool(
-                        name="confluence_create_page",
-                        description="Create a new Confluence page",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "space_key": {
-                                    "type": "string",
-                                    "description": "The key of the space to create the page in "
-                                    "(usually a short uppercase code like 'DEV', 'TEAM', or 'DOC')",
-                                },
-                                "title": {
-                                    "type": "string",
-                                    "description": "The title of the page",
-                                },
-                                "content": {
-                                    "type": "string",
-                                    "description": "The content of the page in Markdown format. "
-                                    "Supports headings, lists, tables, code blocks, and other "
-                                    "Markdown syntax",
-                                },
-                                "parent_id": {
-                                    "type": "string",
-                                    "description": "Optional parent page ID. If provided, this page "
-                                    "will be created as a child of the specified page",
-                                },
-                            },
-                            "required": ["space_key", "title", "content"],
-                        },
-                    ),
-                    Tool(
-                        name="confluence_update_page",
-                        description="Update an existing Confluence page",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "page_id": {
-                                    "type": "string",
-                                    "description": "The ID of the page to update",
-                                },
-                                "title": {
-                                    "type": "string",
-                                    "description": "The new title of the page",
-                                },
-                                "content": {
-                                    "type": "string",
-                                    "description": "The new content of the page in Markdown format",
-                                },
-                                "is_minor_edit": {
-                                    "type": "boolean",
-                                    "description": "Whether this is a minor edit",
-                                    "default": False,
-                                },
-                                "version_comment": {
-                                    "type": "string",
-                                    "description": "Optional comment for this version",
-                                    "default": "",
-                                },
-                            },
-                            "required": ["page_id", "title", "content"],
-                        },
-                    ),
-                    Tool(
-                        name="confluence_delete_page",
-                        description="Delete an existing Confluence page",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "page_id": {
-                                    "type": "string",
-                                    "description": "The ID of the page to delete",
-                                },
-                            },
-                            "required": ["page_id"],
-                        },
-                    ),
-                    Tool(
-                        name="confluence_attach_content",
-                        description="Attach content to a Confluence page",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "content": {
-                                    "type": "string",
-                                    "format": "binary",
-                                    "description": "The content to attach (bytes)",
-                                },
-                                "name": {
-                                    "type": "string",
-                                    "description": "The name of the attachment",
-                                },
-                                "page_id": {
-                                    "type": "string",
-                                    "description": "The ID of the page to attach the content to",
-                                },
-                            },
-                            "required": ["content", "name", "page_id"],
-                        },
-                    ),
-                ]
-            )
+            tools.extend(CONFLUENCE_WRITE_TOOLS)
 
     # Add Jira tools if Jira is configured
     if ctx and ctx.jira:
         # Always add read operations
-        tools.extend(
-            [
-                Tool(
-                    name="jira_get_issue",
-                    description="Get details of a specific Jira issue including its Epic links and relationship information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "Jira issue key (e.g., 'PROJ-123')",
-                            },
-                            "fields": {
-                                "type": "string",
-                                "description": "Fields to return. Can be a comma-separated list (e.g., 'summary,status,customfield_10010'), '*all' for all fields (including custom fields), or omitted for essential fields only",
-                                "default": "summary,description,status,assignee,reporter,labels,priority,created,updated,issuetype",
-                            },
-                            "expand": {
-                                "type": "string",
-                                "description": (
-                                    "Optional fields to expand. Examples: 'renderedFields' "
-                                    "(for rendered content), 'transitions' (for available "
-                                    "status transitions), 'changelog' (for history)"
-                                ),
-                                "default": None,
-                            },
-                            "comment_limit": {
-                                "type": "integer",
-                                "description": (
-                                    "Maximum number of comments to include "
-                                    "(0 or null for no comments)"
-                                ),
-                                "minimum": 0,
-                                "maximum": 100,
-                                "default": 10,
-                            },
-                            "properties": {
-                                "type": "string",
-                                "description": "A comma-separated list of issue properties to return",
-                                "default": None,
-                            },
-                            "update_history": {
-                                "type": "boolean",
-                                "description": "Whether to update the issue view history for the requesting user",
-                                "default": True,
-                            },
-                        },
-                        "required": ["issue_key"],
-                    },
-                ),
-                Tool(
-                    name="jira_search",
-                    description="Search Jira issues using JQL (Jira Query Language)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "jql": {
-                                "type": "string",
-                                "description": "JQL query string (Jira Query Language). Examples:\n"
-                                '- Find Epics: "issuetype = Epic AND project = PROJ"\n'
-                                '- Find issues in Epic: "parent = PROJ-123"\n'
-                                "- Find by status: \"status = 'In Progress' AND project = PROJ\"\n"
-                                '- Find by assignee: "assignee = currentUser()"\n'
-                                '- Find recently updated: "updated >= -7d AND project = PROJ"\n'
-                                '- Find by label: "labels = frontend AND project = PROJ"\n'
-                                '- Find by priority: "priority = High AND project = PROJ"',
-                            },
-                            "fields": {
-                                "type": "string",
-                                "description": (
-                                    "Comma-separated fields to return in the results. "
-                                    "Use '*all' for all fields, or specify individual "
-                                    "fields like 'summary,status,assignee,priority'"
-                                ),
-                                "default": "summary,description,status,assignee,reporter,labels,priority,created,updated,issuetype",
-                            },
-                            "limit": {
-                                "type": "number",
-                                "description": "Maximum number of results (1-50)",
-                                "default": 10,
-                                "minimum": 1,
-                                "maximum": 50,
-                            },
-                            "startAt": {
-                                "type": "number",
-                                "description": "Starting index for pagination (0-based)",
-                                "default": 0,
-                                "minimum": 0,
-                            },
-                            "projects_filter": {
-                                "type": "string",
-                                "description": "Comma-separated list of project keys to filter results by. Overrides the environment variable JIRA_PROJECTS_FILTER if provided.",
-                            },
-                        },
-                        "required": ["jql"],
-                    },
-                ),
-                Tool(
-                    name="jira_get_project_issues",
-                    description="Get all issues for a specific Jira project",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_key": {
-                                "type": "string",
-                                "description": "The project key",
-                            },
-                            "limit": {
-                                "type": "number",
-                                "description": "Maximum number of results (1-50)",
-                                "default": 10,
-                                "minimum": 1,
-                                "maximum": 50,
-                            },
-                            "startAt": {
-                                "type": "number",
-                                "description": "Starting index for pagination (0-based)",
-                                "default": 0,
-                                "minimum": 0,
-                            },
-                        },
-                        "required": ["project_key"],
-                    },
-                ),
-                Tool(
-                    name="jira_get_epic_issues",
-                    description="Get all issues linked to a specific epic",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "epic_key": {
-                                "type": "string",
-                                "description": "The key of the epic (e.g., 'PROJ-123')",
-                            },
-                            "limit": {
-                                "type": "number",
-                                "description": "Maximum number of issues to return (1-50)",
-                                "default": 10,
-                                "minimum": 1,
-                                "maximum": 50,
-                            },
-                            "startAt": {
-                                "type": "number",
-                                "description": "Starting index for pagination (0-based)",
-                                "default": 0,
-                                "minimum": 0,
-                            },
-                        },
-                        "required": ["epic_key"],
-                    },
-                ),
-                Tool(
-                    name="jira_get_transitions",
-                    description="Get available status transitions for a Jira issue",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "Jira issue key (e.g., 'PROJ-123')",
-                            },
-                        },
-                        "required": ["issue_key"],
-                    },
-                ),
-                Tool(
-                    name="jira_get_worklog",
-                    description="Get worklog entries for a Jira issue",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "Jira issue key (e.g., 'PROJ-123')",
-                            },
-                        },
-                        "required": ["issue_key"],
-                    },
-                ),
-                Tool(
-                    name="jira_download_attachments",
-                    description="Download attachments from a Jira issue",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "Jira issue key (e.g., 'PROJ-123')",
-                            },
-                            "target_dir": {
-                                "type": "string",
-                                "description": "Directory where attachments should be saved",
-                            },
-                        },
-                        "required": ["issue_key", "target_dir"],
-                    },
-                ),
-                Tool(
-                    name="jira_get_agile_boards",
-                    description="Get jira agile boards by name, project key, or type",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "board_name": {
-                                "type": "string",
-                                "description": "The name of board, support fuzzy search",
-                            },
-                            "project_key": {
-                                "type": "string",
-                                "description": "Jira project key (e.g., 'PROJ-123')",
-                            },
-                            "board_type": {
-                                "type": "string",
-                                "description": "The type of jira board (e.g., 'scrum', 'kanban')",
-                            },
-                            "startAt": {
-                                "type": "number",
-                                "description": "Starting index for pagination (0-based)",
-                                "default": 0,
-                            },
-                            "limit": {
-                                "type": "number",
-                                "description": "Maximum number of results (1-50)",
-                                "default": 10,
-                                "minimum": 1,
-                                "maximum": 50,
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="jira_get_board_issues",
-                    description="Get all issues linked to a specific board",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "board_id": {
-                                "type": "string",
-                                "description": "The id of the board (e.g., '1001')",
-                            },
-                            "jql": {
-                                "type": "string",
-                                "description": "JQL query string (Jira Query Language). Examples:\n"
-                                '- Find Epics: "issuetype = Epic AND project = PROJ"\n'
-                                '- Find issues in Epic: "parent = PROJ-123"\n'
-                                "- Find by status: \"status = 'In Progress' AND project = PROJ\"\n"
-                                '- Find by assignee: "assignee = currentUser()"\n'
-                                '- Find recently updated: "updated >= -7d AND project = PROJ"\n'
-                                '- Find by label: "labels = frontend AND project = PROJ"\n'
-                                '- Find by priority: "priority = High AND project = PROJ"',
-                            },
-                            "fields": {
-                                "type": "string",
-                                "description": (
-                                    "Comma-separated fields to return in the results. "
-                                    "Use '*all' for all fields, or specify individual "
-                                    "fields like 'summary,status,assignee,priority'"
-                                ),
-                                "default": "*all",
-                            },
-                            "startAt": {
-                                "type": "number",
-                                "description": "Starting index for pagination (0-based)",
-                                "default": 0,
-                            },
-                            "limit": {
-                                "type": "number",
-                                "description": "Maximum number of results (1-50)",
-                                "default": 10,
-                                "minimum": 1,
-                                "maximum": 50,
-                            },
-                            "expand": {
-                                "type": "string",
-                                "description": "Fields to expand in the response (e.g., 'version', 'body.storage')",
-                                "default": "version",
-                            },
-                        },
-                        "required": ["board_id", "jql"],
-                    },
-                ),
-                Tool(
-                    name="jira_get_sprints_from_board",
-                    description="Get jira sprints from board by state",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "board_id": {
-                                "type": "string",
-                                "description": "The id of board (e.g., '1000')",
-                            },
-                            "state": {
-                                "type": "string",
-                                "description": "Sprint state (e.g., 'active', 'future', 'closed')",
-                            },
-                            "startAt": {
-                                "type": "number",
-                                "description": "Starting index for pagination (0-based)",
-                                "default": 0,
-                            },
-                            "limit": {
-                                "type": "number",
-                                "description": "Maximum number of results (1-50)",
-                                "default": 10,
-                                "minimum": 1,
-                                "maximum": 50,
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="jira_get_sprint_issues",
-                    description="Get jira issues from sprint",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "sprint_id": {
-                                "type": "string",
-                                "description": "The id of sprint (e.g., '10001')",
-                            },
-                            "fields": {
-                                "type": "string",
-                                "description": (
-                                    "Comma-separated fields to return in the results. "
-                                    "Use '*all' for all fields, or specify individual "
-                                    "fields like 'summary,status,assignee,priority'"
-                                ),
-                                "default": "*all",
-                            },
-                            "startAt": {
-                                "type": "number",
-                                "description": "Starting index for pagination (0-based)",
-                                "default": 0,
-                            },
-                            "limit": {
-                                "type": "number",
-                                "description": "Maximum number of results (1-50)",
-                                "default": 10,
-                                "minimum": 1,
-                                "maximum": 50,
-                            },
-                        },
-                        "required": ["sprint_id"],
-                    },
-                ),
-            ]
-        )
+        tools.extend(JIRA_READ_TOOLS)
 
         # Only add write operations if not in read-only mode
         if not read_only:
-            tools.extend(
-                [
-                    Tool(
-                        name="jira_create_issue",
-                        description="Create a new Jira issue with optional Epic link or parent for subtasks",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "project_key": {
-                                    "type": "string",
-                                    "description": (
-                                        "The JIRA project key (e.g. 'PROJ', 'DEV', 'SUPPORT'). "
-                                        "This is the prefix of issue keys in your project. "
-                                        "Never assume what it might be, always ask the user."
-                                    ),
-                                },
-                                "summary": {
-                                    "type": "string",
-                                    "description": "Summary/title of the issue",
-                                },
-                                "issue_type": {
-                                    "type": "string",
-                                    "description": (
-                                        "Issue type (e.g. 'Task', 'Bug', 'Story', 'Epic', 'Subtask'). "
-                                        "The available types depend on your project configuration. "
-                                        "For subtasks, use 'Subtask' (not 'Sub-task') and include parent in additional_fields."
-                                    ),
-                                },
-                                "assignee": {
-                                    "type": "string",
-                                    "description": "Assignee of the ticket (accountID, full name or e-mail)",
-                                    "default": None,
-                                },
-                                "description": {
-                                    "type": "string",
-                                    "description": "Issue description",
-                                    "default": "",
-                                },
-                                "components": {
-                                    "type": "string",
-                                    "description": "Comma-separated list of component names to assign (e.g., 'Frontend,API')",
-                                    "default": "",
-                                },
-                                "additional_fields": {
-                                    "type": "string",
-                                    "description": (
-                                        "Optional JSON string of additional fields to set. "
-                                        "Examples:\n"
-                                        '- Set priority: {"priority": {"name": "High"}}\n'
-                                        '- Add labels: {"labels": ["frontend", "urgent"]}\n'
-                                        '- Link to parent (for any issue type): {"parent": "PROJ-123"}\n'
-                                        '- Set Fix Version/s: {"fixVersions": [{"id": "10020"}]}\n'
-                                        '- Custom fields: {"customfield_10010": "value"}'
-                                    ),
-                                    "default": "{}",
-                                },
-                            },
-                            "required": ["project_key", "summary", "issue_type"],
-                        },
-                    ),
-                    Tool(
-                        name="jira_update_issue",
-                        description="Update an existing Jira issue including changing status, adding Epic links, updating fields, etc.",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "issue_key": {
-                                    "type": "string",
-                                    "description": "Jira issue key (e.g., 'PROJ-123')",
-                                },
-                                "fields": {
-                                    "type": "string",
-                                    "description": (
-                                        "A valid JSON object of fields to update as a string. "
-                                        'Example: \'{"summary": "New title", "description": "Updated description", '
-                                        '"priority": {"name": "High"}, "assignee": {"name": "john.doe"}}\''
-                                    ),
-                                },
-                                "additional_fields": {
-                                    "type": "string",
-                                    "description": "Optional JSON string of additional fields to update. Use this for custom fields or more complex updates.",
-                                    "default": "{}",
-                                },
-                                "attachments": {
-                                    "type": "string",
-                                    "description": "Optional JSON string or comma-separated list of file paths to attach to the issue. "
-                                    'Example: "/path/to/file1.txt,/path/to/file2.txt" or "["/path/to/file1.txt","/path/to/file2.txt"]"',
-                                },
-                            },
-                            "required": ["issue_key", "fields"],
-                        },
-                    ),
-                    Tool(
-                        name="jira_delete_issue",
-                        description="Delete an existing Jira issue",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "issue_key": {
-                                    "type": "string",
-                                    "description": "Jira issue key (e.g. PROJ-123)",
-                                },
-                            },
-                            "required": ["issue_key"],
-                        },
-                    ),
-                    Tool(
-                        name="jira_add_comment",
-                        description="Add a comment to a Jira issue",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "issue_key": {
-                                    "type": "string",
-                                    "description": "Jira issue key (e.g., 'PROJ-123')",
-                                },
-                                "comment": {
-                                    "type": "string",
-                                    "description": "Comment text in Markdown format",
-                                },
-                            },
-                            "required": ["issue_key", "comment"],
-                        },
-                    ),
-                    Tool(
-                        name="jira_add_worklog",
-                        description="Add a worklog entry to a Jira issue",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "issue_key": {
-                                    "type": "string",
-                                    "description": "Jira issue key (e.g., 'PROJ-123')",
-                                },
-                                "time_spent": {
-                                    "type": "string",
-                                    "description": (
-                                        "Time spent in Jira format. Examples: "
-                                        "'1h 30m' (1 hour and 30 minutes), "
-                                        "'1d' (1 day), '30m' (30 minutes), "
-                                        "'4h' (4 hours)"
-                                    ),
-                                },
-                                "comment": {
-                                    "type": "string",
-                                    "description": "Optional comment for the worklog in Markdown format",
-                                },
-                                "started": {
-                                    "type": "string",
-                                    "description": (
-                                        "Optional start time in ISO format. "
-                                        "If not provided, the current time will be used. "
-                                        "Example: '2023-08-01T12:00:00.000+0000'"
-                                    ),
-                                },
-                            },
-                            "required": ["issue_key", "time_spent"],
-                        },
-                    ),
-                    Tool(
-                        name="jira_link_to_epic",
-                        description="Link an existing issue to an epic",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "issue_key": {
-                                    "type": "string",
-                                    "description": "The key of the issue to link (e.g., 'PROJ-123')",
-                                },
-                                "epic_key": {
-                                    "type": "string",
-                                    "description": "The key of the epic to link to (e.g., 'PROJ-456')",
-                                },
-                            },
-                            "required": ["issue_key", "epic_key"],
-                        },
-                    ),
-                    Tool(
-                        name="jira_transition_issue",
-                        description="Transition a Jira issue to a new status",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "issue_key": {
-                                    "type": "string",
-                                    "description": "Jira issue key (e.g., 'PROJ-123')",
-                                },
-                                "transition_id": {
-                                    "type": "string",
-                                    "description": (
-                                        "ID of the transition to perform. Use the jira_get_transitions tool first "
-                                        "to get the available transition IDs for the issue. "
-                                        "Example values: '11', '21', '31'"
-                                    ),
-                                },
-                                "fields": {
-                                    "type": "string",
-                                    "description": (
-                                        "JSON string of fields to update during the transition. "
-                                        "Some transitions require specific fields to be set. "
-                                        'Example: \'{"resolution": {"name": "Fixed"}}\''
-                                    ),
-                                    "default": "{}",
-                                },
-                                "comment": {
-                                    "type": "string",
-                                    "description": (
-                                        "Comment to add during the transition (optional). "
-                                        "This will be visible in the issue history."
-                                    ),
-                                },
-                            },
-                            "required": ["issue_key", "transition_id"],
-                        },
-                    ),
-                ]
-            )
+            tools.extend(JIRA_WRITE_TOOLS)
 
     return tools
 
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
-    """Handle tool calls for Confluence and Jira operations."""
-    ctx = app.request_context.lifespan_context
-
-    # Check if we're in read-only mode for write operations
-    read_only = is_read_only_mode()
-
+def format_comment(comment: Any) -> dict[str, Any]:
+    """Format a comment model or raw comment dict for a tool response."""
+    if hasattr(comment, "to_simplified_dict"):
+        # Cast the return value to dict[str, Any] to satisfy the type checker
+        return cast(dict[str, Any], comment.to_simplified_dict())
+    return {
+        "id": comment.get("id"),
+        "author": comment.get("author", {}).get("displayName", "Unknown"),
+        "created": comment.get("created"),
+        "body": comment.get("body"),
+    }
+
+
+def get_pagination(arguments: dict[str, Any]) -> tuple[int, int]:
+    """Read the paging arguments of a Jira tool call.
+
+    Args:
+        arguments: The tool arguments, with optional startAt and limit
+
+    Returns:
+        The start offset, at least 0, and the limit, between 1 and MAX_RESULTS
+        (10 when not given)
+    """
+    start_at = max(int(arguments.get("startAt", 0)), 0)
+    limit = min(max(int(arguments.get("limit", 10)), 1), MAX_RESULTS)
+    return start_at, limit
+
+
+def format_search_result(search_result: "JiraSearchResult") -> str:
+    """Serialize a Jira search result with its paging metadata.
+
+    Args:
+        search_result: The search result returned by a fetcher
+
+    Returns:
+        The JSON document with total, start_at, max_results and the issues
+    """
+    return format_json(
+        {
+            "total": search_result.total,
+            "start_at": search_result.start_at,
+            "max_results": search_result.max_results,
+            "issues": list(map(TO_SIMPLIFIED_DICT, search_result.issues)),
+        }
+    )
+
+
+def parse_attachments(value: Any) -> list[str]:
+    """Normalize the attachments argument of jira_update_issue to a list of paths.
+
+    Args:
+        value: A list of paths, a JSON array or string, a comma-separated
+            string, or a single path
+
+    Returns:
+        The attachment paths, or an empty list if none were given
+    """
+    if not value:
+        return []
+    if isinstance(value, list):
+        return value
+    if not isinstance(value, str):
+        return []
     try:
-        # Helper functions for formatting results
-        def format_comment(comment: Any) -> dict[str, Any]:
-            if hasattr(comment, "to_simplified_dict"):
-                # Cast the return value to dict[str, Any] to satisfy the type checker
-                return cast(dict[str, Any], comment.to_simplified_dict())
-            return {
-                "id": comment.get("id"),
-                "author": comment.get("author", {}).get("displayName", "Unknown"),
-                "created": comment.get("created"),
-                "body": comment.get("body"),
-            }
+        parsed = parse_json(value)
+    except json.JSONDecodeError:
+        # Comma-separated list or a plain single path
+        if "," in value:
+            return [path for part in value.split(",") if (path := part.strip())]
+        return [value]
+    return parsed if isinstance(parsed, list) else [parsed]
+
+
+def filter_existing_paths(paths: list[str]) -> list[str]:
+    """Keep the paths that exist, logging a warning for each missing one.
+
+    Args:
+        paths: The file paths to check
+
+    Returns:
+        The existing paths, in their original order
+    """
+    existing_paths = []
+    for path in paths:
+        if os.path.exists(path):
+            existing_paths.append(path)
+        else:
+            logger.warning(f"Attachment file not found: {path}")
+    return existing_paths
 
-        # Confluence operations
-        if name == "confluence_search" and ctx and ctx.confluence:
-            if not ctx or not ctx.confluence:
-                raise ValueError("Confluence is not configured.")
-
-            query = arguments.get("query", "")
-            limit = min(int(arguments.get("limit", 10)), 50)
-            spaces_filter = arguments.get("spaces_filter")
-
-            # Check if the query is a simple search term or already a CQL query
-            if query and not any(
-                x in query
-                for x in ["=", "~", ">", "<", " AND ", " OR ", "currentUser()"]
-            ):
-                # Convert simple search term to CQL text search
-                # This will search in all content (title, body, etc.)
-                query = f'text ~ "{query}"'
-                logger.info(f"Converting simple search term to CQL: {query}")
-
-            pages = ctx.confluence.search(
-                query, limit=limit, spaces_filter=spaces_filter
-            )
 
-            # Format results using the to_simplified_dict method
-            search_results = [page.to_simplified_dict() for page in pages]
+def check_required_arguments(name: str, arguments: dict[str, Any]) -> None:
+    """Raise if any argument the tool's schema requires was not sent.
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(search_results, indent=2, ensure_ascii=False),
-                )
-            ]
+    Handlers call this after their configuration and read-only checks, so
+    those errors take precedence. Empty strings, 0 and False are valid values.
 
-        elif name == "confluence_get_page" and ctx and ctx.confluence:
-            if not ctx or not ctx.confluence:
-                raise ValueError("Confluence is not configured.")
+    Args:
+        name: The tool name
+        arguments: The tool call arguments
 
-            page_id = arguments.get("page_id")
-            include_metadata = arguments.get("include_metadata", True)
-            convert_to_markdown = arguments.get("convert_to_markdown", True)
+    Raises:
+        ValueError: If one or more required arguments are missing
+    """
+    missing = [arg for arg in REQUIRED_ARGUMENTS[name] if arguments.get(arg) is None]
+    if missing:
+        raise ValueError(f"Missing required parameters: {', '.join(missing)}")
 
-            page = ctx.confluence.get_page_content(
-                page_id, convert_to_markdown=convert_to_markdown
-            )
 
-            if include_metadata:
-                # The to_simplified_dict method already includes the content,
-                # so we don't need to include it separately at the root level
-                result = {
-                    "metadata": page.to_simplified_dict(),
-                }
-            else:
-                # For backward compatibility, keep returning content directly
-                result = {"content": page.content}
-
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
-
-        elif name == "confluence_get_page_children" and ctx and ctx.confluence:
-            if not ctx or not ctx.confluence:
-                raise ValueError("Confluence is not configured.")
-
-            parent_id = arguments.get("parent_id")
-            expand = arguments.get("expand", "version")
-            limit = min(int(arguments.get("limit", 25)), 50)
-            include_content = arguments.get("include_content", False)
-            convert_to_markdown = arguments.get("convert_to_markdown", True)
-            start = arguments.get("start", 0)
-
-            # Add body.storage to expand if content is requested
-            if include_content and "body" not in expand:
-                expand = f"{expand},body.storage" if expand else "body.storage"
-
-            pages = None  # Initialize pages to None before try block
-
-            try:
-                pages = ctx.confluence.get_page_children(
-                    page_id=parent_id,
-                    start=start,
-                    limit=limit,
-                    expand=expand,
-                    convert_to_markdown=convert_to_markdown,
-                )
+ToolHandler = Callable[
+    [AppContext | None, dict[str, Any]], Awaitable[Sequence[TextContent]]
+]
 
-                child_pages = [page.to_simplified_dict() for page in pages]
 
-                result = {
-                    "parent_id": parent_id,
-                    "total": len(child_pages),
-                    "limit": limit,
-                    "results": child_pages,
-                }
+async def handle_confluence_search(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Search Confluence content using simple terms or CQL."""
+    if not ctx or not ctx.confluence:
+        raise ValueError("Confluence is not configured.")
 
-            except Exception as e:
-                # --- Error Handling ---
-                logger.error(
-                    f"Error getting/processing children for page ID {parent_id}: {e}",
-                    exc_info=True,
-                )
-                result = {"error": f"Failed to get child pages: {e}"}
-
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(
-                        result,
-                        indent=2,
-                        ensure_ascii=False,
-                    ),
-                )
-            ]
+    check_required_arguments("confluence_search", arguments)
 
-        elif name == "confluence_get_page_ancestors" and ctx and ctx.confluence:
-            if not ctx or not ctx.confluence:
-                raise ValueError("Confluence is not configured.")
+    query = arguments.get("query", "")
+    limit = min(int(arguments.get("limit", 10)), MAX_RESULTS)
+    spaces_filter = arguments.get("spaces_filter")
+    start = int(arguments.get("start", 0))
 
-            page_id = arguments.get("page_id")
+    # Check if the query is a simple search term or already a CQL query
+    if query and not CQL_OPERATORS_PATTERN.search(query):
+        # Convert simple search term to CQL text search
+        # This will search in all content (title, body, etc.)
+        query = f'text ~ "{query}"'
+        logger.info(f"Converting simple search term to CQL: {query}")
 
-            # Get the ancestor pages
-            ancestors = ctx.confluence.get_page_ancestors(page_id)
+    pages = await run_blocking(
+        ctx.confluence.search,
+        query,
+        limit=limit,
+        spaces_filter=spaces_filter,
+        start=start,
+    )
 
-            # Format results
-            ancestor_pages = [page.to_simplified_dict() for page in ancestors]
+    # Format results using the to_simplified_dict method
+    search_results = list(map(TO_SIMPLIFIED_DICT, pages))
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(ancestor_pages, indent=2, ensure_ascii=False),
-                )
-            ]
+    return [
+        TextContent(
+            type="text",
+            text=format_json(search_results),
+        )
+    ]
+
+
+async def handle_confluence_get_page(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get content of a specific Confluence page by ID."""
+    if not ctx or not ctx.confluence:
+        raise ValueError("Confluence is not configured.")
+
+    check_required_arguments("confluence_get_page", arguments)
+
+    page_id = arguments.get("page_id")
+    include_metadata = arguments.get("include_metadata", True)
+    convert_to_markdown = arguments.get("convert_to_markdown", True)
+    include_ancestors = arguments.get("include_ancestors", False)
+
+    page = await run_blocking(
+        ctx.confluence.get_page_content,
+        page_id,
+        convert_to_markdown=convert_to_markdown,
+        include_ancestors=include_ancestors,
+    )
+
+    if include_metadata:
+        # The to_simplified_dict method already includes the content,
+        # so we don't need to include it separately at the root level
+        result: dict[str, Any] = {
+            "metadata": page.to_simplified_dict(),
+        }
+    else:
+        # For backward compatibility, keep returning content directly
+        result = {"content": page.content}
+
+    if include_ancestors:
+        from .models.confluence import ConfluencePage
+
+        # Returned once, at the top level and formatted the same way as
+        # confluence_get_page_ancestors, rather than also inside the metadata
+        if include_metadata:
+            result["metadata"].pop("ancestors", None)
+        result["ancestors"] = [
+            ConfluencePage.from_api_response(
+                ancestor, base_url=ctx.confluence.config.url, include_body=False
+            ).to_simplified_dict()
+            for ancestor in page.ancestors
+        ]
+
+    return [TextContent(type="text", text=format_json(result))]
+
+
+async def handle_confluence_get_pages(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get several Confluence pages by ID."""
+    if not ctx or not ctx.confluence:
+        raise ValueError("Confluence is not configured.")
+
+    check_required_arguments("confluence_get_pages", arguments)
+
+    page_ids = arguments.get("page_ids")
+    if not isinstance(page_ids, list):
+        raise ValueError("page_ids must be a list of page IDs")
+    if len(page_ids) > MAX_RESULTS:
+        raise ValueError(f"At most {MAX_RESULTS} page IDs can be requested at once")
+    page_ids = [str(page_id) for page_id in page_ids]
+    include_content = arguments.get("include_content", False)
+    convert_to_markdown = arguments.get("convert_to_markdown", True)
+
+    expand = "version,space,body.storage" if include_content else "version,space"
+    pages = await run_blocking(
+        ctx.confluence.get_pages,
+        page_ids,
+        expand=expand,
+        convert_to_markdown=convert_to_markdown,
+    )
+
+    found_ids = {page.id for page in pages}
+    result = {
+        "total": len(pages),
+        "results": list(map(TO_SIMPLIFIED_DICT, pages)),
+        "not_found": [page_id for page_id in page_ids if page_id not in found_ids],
+    }
+
+    return [TextContent(type="text", text=format_json(result))]
+
+
+async def handle_confluence_get_page_children(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get child pages of a specific Confluence page."""
+    if not ctx or not ctx.confluence:
+        raise ValueError("Confluence is not configured.")
+
+    check_required_arguments("confluence_get_page_children", arguments)
+
+    parent_id = arguments.get("parent_id")
+    expand = arguments.get("expand", "version")
+    limit = min(int(arguments.get("limit", 25)), MAX_RESULTS)
+    include_content = arguments.get("include_content", False)
+    convert_to_markdown = arguments.get("convert_to_markdown", True)
+    start = int(arguments.get("start", 0))
+
+    # Add body.storage to expand if content is requested
+    if include_content and "body" not in expand:
+        expand = f"{expand},body.storage" if expand else "body.storage"
+
+    pages = None  # Initialize pages to None before try block
 
-        elif name == "confluence_get_comments" and ctx and ctx.confluence:
-            if not ctx or not ctx.confluence:
-                raise ValueError("Confluence is not configured.")
+    try:
+        pages = await run_blocking(
+            ctx.confluence.get_page_children,
+            page_id=parent_id,
+            start=start,
+            limit=limit,
+            expand=expand,
+            convert_to_markdown=convert_to_markdown,
+        )
 
-            page_id = arguments.get("page_id")
-            comments = ctx.confluence.get_page_comments(page_id)
+        child_pages = list(map(TO_SIMPLIFIED_DICT, pages))
 
-            # Format comments using their to_simplified_dict method if available
-            formatted_comments = [format_comment(comment) for comment in comments]
+        result = {
+            "parent_id": parent_id,
+            "total": len(child_pages),
+            "start": start,
+            "limit": limit,
+            "results": child_pages,
+        }
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(formatted_comments, indent=2, ensure_ascii=False),
-                )
-            ]
+    except Exception as e:
+        # --- Error Handling ---
+        logger.error(
+            f"Error getting/processing children for page ID {parent_id}: {e}",
+            exc_info=True,
+        )
+        result = {"error": f"Failed to get child pages: {e}"}
 
-        elif name == "confluence_create_page":
-            if not ctx or not ctx.confluence:
-                raise ValueError("Confluence is not configured.")
+    return [
+        TextContent(
+            type="text",
+            text=format_json(result),
+        )
+    ]
 
-            # Write operation - check read-only mode
-            if read_only:
-                return [
-                    TextContent(
-                        "Operation 'confluence_create_page' is not available in read-only mode."
-                    )
-                ]
 
-            # Extract arguments
-            space_key = arguments.get("space_key")
-            title = arguments.get("title")
-            content = arguments.get("content")
-            parent_id = arguments.get("parent_id")
-
-            # Create the page (with automatic markdown conversion)
-            page = ctx.confluence.create_page(
-                space_key=space_key,
-                title=title,
-                body=content,
-                parent_id=parent_id,
-                is_markdown=True,
-            )
+async def handle_confluence_get_page_ancestors(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get ancestor (parent) pages of a specific Confluence page."""
+    if not ctx or not ctx.confluence:
+        raise ValueError("Confluence is not configured.")
 
-            # Format the result
-            result = page.to_simplified_dict()
+    check_required_arguments("confluence_get_page_ancestors", arguments)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Page created successfully:\n{json.dumps(result, indent=2, ensure_ascii=False)}",
-                )
-            ]
+    page_id = arguments.get("page_id")
 
-        elif name == "confluence_update_page":
-            if not ctx or not ctx.confluence:
-                raise ValueError("Confluence is not configured.")
+    # Get the ancestor pages
+    ancestors = await run_blocking(ctx.confluence.get_page_ancestors, page_id)
 
-            # Write operation - check read-only mode
-            if read_only:
-                return [
-                    TextContent(
-                        "Operation 'confluence_update_page' is not available in read-only mode."
-                    )
-                ]
+    # Format results
+    ancestor_pages = list(map(TO_SIMPLIFIED_DICT, ancestors))
 
-            page_id = arguments.get("page_id")
-            title = arguments.get("title")
-            content = arguments.get("content")
-            is_minor_edit = arguments.get("is_minor_edit", False)
-            version_comment = arguments.get("version_comment", "")
+    return [
+        TextContent(
+            type="text",
+            text=format_json(ancestor_pages),
+        )
+    ]
 
-            if not page_id or not title or not content:
-                raise ValueError(
-                    "Missing required parameters: page_id, title, and content are required."
-                )
 
-            # Update the page (with automatic markdown conversion)
-            updated_page = ctx.confluence.update_page(
-                page_id=page_id,
-                title=title,
-                body=content,
-                is_minor_edit=is_minor_edit,
-                version_comment=version_comment,
-                is_markdown=True,
-            )
+async def handle_confluence_get_comments(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get comments for a specific Confluence page."""
+    if not ctx or not ctx.confluence:
+        raise ValueError("Confluence is not configured.")
 
-            # Format results
-            page_data = updated_page.to_simplified_dict()
+    check_required_arguments("confluence_get_comments", arguments)
 
-            return [TextContent(type="text", text=json.dumps({"page": page_data}))]
+    page_id = arguments.get("page_id")
+    comments = await run_blocking(ctx.confluence.get_page_comments, page_id)
 
-        elif name == "confluence_delete_page":
-            if not ctx or not ctx.confluence:
-                raise ValueError("Confluence is not configured.")
+    # Comments are either all models or all raw dicts, so pick the formatter once
+    if comments and hasattr(comments[0], "to_simplified_dict"):
+        formatted_comments = list(map(TO_SIMPLIFIED_DICT, comments))
+    else:
+        formatted_comments = [format_comment(comment) for comment in comments]
 
-            # Write operation - check read-only mode
-            if read_only:
-                return [
-                    TextContent(
-                        "Operation 'confluence_delete_page' is not available in read-only mode."
-                    )
-                ]
+    return [
+        TextContent(
+            type="text",
+            text=format_json(formatted_comments),
+        )
+    ]
+
+
+async def handle_confluence_create_page(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Create a new Confluence page."""
+    if not ctx or not ctx.confluence:
+        raise ValueError("Confluence is not configured.")
+
+    # Write operation - check read-only mode
+    if ctx.read_only:
+        return [
+            TextContent(
+                type="text",
+                text="Operation 'confluence_create_page' is not available in read-only mode.",
+            )
+        ]
+
+    check_required_arguments("confluence_create_page", arguments)
+
+    # Extract arguments
+    space_key = arguments.get("space_key")
+    title = arguments.get("title")
+    content = arguments.get("content")
+    parent_id = arguments.get("parent_id")
+
+    # Create the page (with automatic markdown conversion)
+    page = await run_blocking(
+        ctx.confluence.create_page,
+        space_key=space_key,
+        title=title,
+        body=content,
+        parent_id=parent_id,
+        is_markdown=True,
+    )
+
+    # Format the result
+    result = page.to_simplified_dict()
+
+    return [
+        TextContent(
+            type="text",
+            text=f"Page created successfully:\n{format_json(result)}",
+        )
+    ]
+
+
+async def handle_confluence_update_page(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Update an existing Confluence page."""
+    if not ctx or not ctx.confluence:
+        raise ValueError("Confluence is not configured.")
+
+    # Write operation - check read-only mode
+    if ctx.read_only:
+        return [
+            TextContent(
+                type="text",
+                text="Operation 'confluence_update_page' is not available in read-only mode.",
+            )
+        ]
+
+    check_required_arguments("confluence_update_page", arguments)
+
+    page_id = arguments.get("page_id")
+    title = arguments.get("title")
+    content = arguments.get("content")
+    is_minor_edit = arguments.get("is_minor_edit", False)
+    version_comment = arguments.get("version_comment", "")
+
+    # Update the page (with automatic markdown conversion)
+    updated_page = await run_blocking(
+        ctx.confluence.update_page,
+        page_id=page_id,
+        title=title,
+        body=content,
+        is_minor_edit=is_minor_edit,
+        version_comment=version_comment,
+        is_markdown=True,
+    )
+
+    # Format results
+    page_data = updated_page.to_simplified_dict()
+
+    return [TextContent(type="text", text=format_json({"page": page_data}))]
+
+
+async def handle_confluence_delete_page(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Delete an existing Confluence page."""
+    if not ctx or not ctx.confluence:
+        raise ValueError("Confluence is not configured.")
+
+    # Write operation - check read-only mode
+    if ctx.read_only:
+        return [
+            TextContent(
+                type="text",
+                text="Operation 'confluence_delete_page' is not available in read-only mode.",
+            )
+        ]
 
-            page_id = arguments.get("page_id")
+    check_required_arguments("confluence_delete_page", arguments)
 
-            if not page_id:
-                raise ValueError("Missing required parameter: page_id is required.")
+    page_id = arguments.get("page_id")
 
-            try:
-                # Delete the page
-                result = ctx.confluence.delete_page(page_id=page_id)
+    try:
+        # Delete the page
+        result = await run_blocking(ctx.confluence.delete_page, page_id=page_id)
 
-                # Format results - our fixed implementation now correctly returns True on success
-                if result:
-                    response = {
-                        "success": True,
-                        "message": f"Page {page_id} deleted successfully",
-                    }
-                else:
-                    # This branch should rarely be hit with our updated implementation
-                    # but we keep it for safety
-                    response = {
+        # Format results - our fixed implementation now correctly returns True on success
+        if result:
+            response = {
+                "success": True,
+                "message": f"Page {page_id} deleted successfully",
+            }
+        else:
+            # This branch should rarely be hit with our updated implementation
+            # but we keep it for safety
+            response = {
+                "success": False,
+                "message": f"Unable to delete page {page_id}. The API request completed but deletion was unsuccessful.",
+            }
+
+        return [
+            TextContent(
+                type="text",
+                text=format_json(response),
+            )
+        ]
+    except Exception as e:
+        # API call failed with an exception
+        logger.error(f"Error deleting Confluence page {page_id}: {str(e)}")
+        return [
+            TextContent(
+                type="text",
+                text=format_json(
+                    {
                         "success": False,
-                        "message": f"Unable to delete page {page_id}. The API request completed but deletion was unsuccessful.",
+                        "message": f"Error deleting page {page_id}",
+                        "error": str(e),
                     }
+                ),
+            )
+        ]
+
+
+async def handle_confluence_attach_content(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Attach content to a Confluence page."""
+    if not ctx or not ctx.confluence:
+        raise ValueError("Confluence is not configured.")
+
+    # Write operation - check read-only mode
+    if ctx.read_only:
+        return [
+            TextContent(
+                type="text",
+                text="Operation 'confluence_attach_content' is not available in read-only mode.",
+            )
+        ]
 
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(response, indent=2, ensure_ascii=False),
-                    )
-                ]
-            except Exception as e:
-                # API call failed with an exception
-                logger.error(f"Error deleting Confluence page {page_id}: {str(e)}")
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(
-                            {
-                                "success": False,
-                                "message": f"Error deleting page {page_id}",
-                                "error": str(e),
-                            },
-                            indent=2,
-                            ensure_ascii=False,
-                        ),
-                    )
-                ]
+    check_required_arguments("confluence_attach_content", arguments)
 
-        elif name == "confluence_attach_content":
-            if not ctx or not ctx.confluence:
-                raise ValueError("Confluence is not configured.")
+    content = arguments.get("content")
+    name = arguments.get("name")
+    page_id = arguments.get("page_id")
 
-            # Write operation - check read-only mode
-            if read_only:
-                return [
-                    TextContent(
-                        "Operation 'confluence_attach_content' is not available in read-only mode."
-                    )
-                ]
+    try:
+        page = await run_blocking(
+            ctx.confluence.attach_content, content=content, name=name, page_id=page_id
+        )
+        page_data = page.to_simplified_dict()
+        return [
+            TextContent(
+                type="text",
+                text=format_json(page_data),
+            )
+        ]
+    except ApiError as e:
+        return [
+            TextContent(
+                type="text",
+                text=f"Confluence API Error when trying to attach content {name} to page {page_id}: {str(e)}",
+            )
+        ]
+    except RequestException as e:
+        return [
+            TextContent(
+                type="text",
+                text=f"Network error when trying to attach content {name} to page {page_id}: {str(e)}",
+            )
+        ]
 
-            content = arguments.get("content")
-            name = arguments.get("name")
-            page_id = arguments.get("page_id")
 
-            if not content or not name or not page_id:
-                return [
-                    TextContent(
-                        type="text",
-                        text="Error: Missing required parameters: content, name, and page_id are required.",
-                    )
-                ]
+async def handle_jira_get_issue(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get details of a specific Jira issue including its Epic links and relationship information."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
 
-            try:
-                page = ctx.confluence.attach_content(
-                    content=content, name=name, page_id=page_id
-                )
-                page_data = page.to_simplified_dict()
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(
-                            page_data,
-                            indent=2,
-                            ensure_ascii=False,
-                        ),
-                    )
-                ]
-            except ApiError as e:
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Confluence API Error when trying to attach content {name} to page {page_id}: {str(e)}",
-                    )
-                ]
-            except RequestException as e:
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Network error when trying to attach content {name} to page {page_id}: {str(e)}",
-                    )
-                ]
+    check_required_arguments("jira_get_issue", arguments)
 
-        # Jira operations
-        elif name == "jira_get_issue" and ctx and ctx.jira:
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
+    issue_key = arguments.get("issue_key")
+    fields = arguments.get("fields", JIRA_DEFAULT_FIELDS)
+    expand = arguments.get("expand")
+    comment_limit = arguments.get("comment_limit", 10)
+    properties = arguments.get("properties")
+    update_history = arguments.get("update_history", True)
 
-            issue_key = arguments.get("issue_key")
-            fields = arguments.get(
-                "fields",
-                "summary,description,status,assignee,reporter,labels,priority,created,updated,issuetype",
-            )
-            expand = arguments.get("expand")
-            comment_limit = arguments.get("comment_limit", 10)
-            properties = arguments.get("properties")
-            update_history = arguments.get("update_history", True)
-
-            issue = ctx.jira.get_issue(
-                issue_key,
-                fields=fields,
-                expand=expand,
-                comment_limit=comment_limit,
-                properties=properties,
-                update_history=update_history,
-            )
+    issue = await run_blocking(
+        ctx.jira.get_issue,
+        issue_key,
+        fields=fields,
+        expand=expand,
+        comment_limit=comment_limit,
+        properties=properties,
+        update_history=update_history,
+    )
 
-            result = {"content": issue.to_simplified_dict()}
+    result = {"content": issue.to_simplified_dict()}
 
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
+    return [TextContent(type="text", text=format_json(result))]
 
-        elif name == "jira_search" and ctx and ctx.jira:
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
 
-            jql = arguments.get("jql")
-            fields = arguments.get(
-                "fields",
-                "summary,description,status,assignee,reporter,labels,priority,created,updated,issuetype",
-            )
-            limit = min(int(arguments.get("limit", 10)), 50)
-            projects_filter = arguments.get("projects_filter")
-            start_at = int(arguments.get("startAt", 0))  # Get startAt
-
-            search_result = ctx.jira.search_issues(
-                jql,
-                fields=fields,
-                limit=limit,
-                start=start_at,  # Pass start_at here
-                projects_filter=projects_filter,
-            )
+async def handle_jira_search(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Search Jira issues using JQL (Jira Query Language)."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
 
-            # Format results using the to_simplified_dict method
-            issues = [issue.to_simplified_dict() for issue in search_result.issues]
+    check_required_arguments("jira_search", arguments)
 
-            # Include metadata in the response
-            response = {
-                "total": search_result.total,
-                "start_at": search_result.start_at,
-                "max_results": search_result.max_results,
-                "issues": issues,
-            }
+    jql = arguments.get("jql")
+    fields = arguments.get("fields", JIRA_DEFAULT_FIELDS)
+    start_at, limit = get_pagination(arguments)
+    projects_filter = arguments.get("projects_filter")
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(response, indent=2, ensure_ascii=False),
-                )
-            ]
+    search_result = await run_blocking(
+        ctx.jira.search_issues,
+        jql,
+        fields=fields,
+        limit=limit,
+        start=start_at,  # Pass start_at here
+        projects_filter=projects_filter,
+    )
 
-        elif name == "jira_get_project_issues" and ctx and ctx.jira:
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
+    return [TextContent(type="text", text=format_search_result(search_result))]
 
-            project_key = arguments.get("project_key")
-            limit = min(int(arguments.get("limit", 10)), 50)
-            start_at = int(arguments.get("startAt", 0))  # Get startAt
 
-            search_result = ctx.jira.get_project_issues(
-                project_key, start=start_at, limit=limit
-            )
+async def handle_jira_get_project_issues(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get all issues for a specific Jira project."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
 
-            # Format results
-            issues = [issue.to_simplified_dict() for issue in search_result.issues]
+    check_required_arguments("jira_get_project_issues", arguments)
 
-            # Include metadata in the response
-            response = {
-                "total": search_result.total,
-                "start_at": search_result.start_at,
-                "max_results": search_result.max_results,
-                "issues": issues,
-            }
+    project_key = arguments.get("project_key")
+    start_at, limit = get_pagination(arguments)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(response, indent=2, ensure_ascii=False),
-                )
-            ]
+    search_result = await run_blocking(
+        ctx.jira.get_project_issues, project_key, start=start_at, limit=limit
+    )
 
-        elif name == "jira_get_epic_issues" and ctx and ctx.jira:
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
+    return [TextContent(type="text", text=format_search_result(search_result))]
 
-            epic_key = arguments.get("epic_key")
-            limit = min(int(arguments.get("limit", 10)), 50)
-            start_at = int(arguments.get("startAt", 0))  # Get startAt
 
-            # Get issues linked to the epic
-            search_result = ctx.jira.get_epic_issues(
-                epic_key, start=start_at, limit=limit
-            )
+async def handle_jira_get_epic_issues(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get all issues linked to a specific epic."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
 
-            # Format results
-            issues = [issue.to_simplified_dict() for issue in search_result.issues]
+    check_required_arguments("jira_get_epic_issues", arguments)
 
-            # Include metadata in the response
-            response = {
-                "total": search_result.total,
-                "start_at": search_result.start_at,
-                "max_results": search_result.max_results,
-                "issues": issues,
-            }
+    epic_key = arguments.get("epic_key")
+    start_at, limit = get_pagination(arguments)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(response, indent=2, ensure_ascii=False),
-                )
-            ]
+    # Get issues linked to the epic
+    search_result = await run_blocking(
+        ctx.jira.get_epic_issues, epic_key, start=start_at, limit=limit
+    )
 
-        elif name == "jira_get_transitions" and ctx and ctx.jira:
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
+    return [TextContent(type="text", text=format_search_result(search_result))]
 
-            issue_key = arguments.get("issue_key")
 
-            # Get available transitions
-            transitions = ctx.jira.get_available_transitions(issue_key)
+async def handle_jira_get_transitions(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get available status transitions for a Jira issue."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
 
-            # Format transitions
-            formatted_transitions = []
-            for transition in transitions:
-                formatted_transitions.append(
-                    {
-                        "id": transition.get("id"),
-                        "name": transition.get("name"),
-                        "to_status": transition.get("to", {}).get("name"),
-                    }
-                )
+    check_required_arguments("jira_get_transitions", arguments)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(
-                        formatted_transitions, indent=2, ensure_ascii=False
-                    ),
-                )
-            ]
+    issue_key = arguments.get("issue_key")
 
-        elif name == "jira_get_worklog" and ctx and ctx.jira:
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
+    # Get available transitions
+    transitions = await run_blocking(ctx.jira.get_available_transitions, issue_key)
 
-            issue_key = arguments.get("issue_key")
+    # Format transitions
+    formatted_transitions = []
+    for transition in transitions:
+        formatted_transitions.append(
+            {
+                "id": transition.get("id"),
+                "name": transition.get("name"),
+                "to_status": transition.get("to", {}).get("name"),
+            }
+        )
 
-            # Get worklogs
-            worklogs = ctx.jira.get_worklogs(issue_key)
+    return [
+        TextContent(
+            type="text",
+            text=format_json(formatted_transitions),
+        )
+    ]
 
-            result = {"worklogs": worklogs}
 
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
+async def handle_jira_get_worklog(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get worklog entries for a Jira issue."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
 
-        elif name == "jira_download_attachments" and ctx and ctx.jira:
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
+    check_required_arguments("jira_get_worklog", arguments)
 
-            issue_key = arguments.get("issue_key")
-            target_dir = arguments.get("target_dir")
+    issue_key = arguments.get("issue_key")
 
-            if not issue_key:
-                raise ValueError("Missing required parameter: issue_key")
-            if not target_dir:
-                raise ValueError("Missing required parameter: target_dir")
+    # Get worklogs
+    worklogs = await run_blocking(ctx.jira.get_worklogs, issue_key)
 
-            # Download the attachments
-            result = ctx.jira.download_issue_attachments(
-                issue_key=issue_key, target_dir=target_dir
-            )
+    result = {"worklogs": worklogs}
 
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
-
-        elif name == "jira_get_agile_boards" and ctx and ctx.jira:
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
-
-            board_name = arguments.get("board_name")
-            project_key = arguments.get("project_key")
-            board_type = arguments.get("board_type")
-            start_at = int(arguments.get("startAt", 0))
-            limit = min(int(arguments.get("limit", 10)), 50)
-
-            boards = ctx.jira.get_all_agile_boards_model(
-                board_name=board_name,
-                project_key=project_key,
-                board_type=board_type,
-                start=start_at,
-                limit=limit,
-            )
+    return [TextContent(type="text", text=format_json(result))]
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(
-                        [board.to_simplified_dict() for board in boards],
-                        indent=2,
-                        ensure_ascii=False,
-                    ),
-                )
-            ]
-
-        elif name == "jira_get_board_issues" and ctx and ctx.jira:
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
-
-            board_id = arguments.get("board_id")
-            jql = arguments.get("jql")
-            fields = arguments.get("fields", "*all")
-
-            start_at = int(arguments.get("startAt", 0))
-            limit = min(int(arguments.get("limit", 10)), 50)
-            expand = arguments.get("expand", "version")
-
-            search_result = ctx.jira.get_board_issues(
-                board_id=board_id,
-                jql=jql,
-                fields=fields,
-                start=start_at,
-                limit=limit,
-                expand=expand,
-            )
 
-            # Format results
-            issues = [issue.to_simplified_dict() for issue in search_result.issues]
+async def handle_jira_download_attachments(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Download attachments from a Jira issue."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
 
-            # Include metadata in the response
-            response = {
-                "total": search_result.total,
-                "start_at": search_result.start_at,
-                "max_results": search_result.max_results,
-                "issues": issues,
-            }
+    check_required_arguments("jira_download_attachments", arguments)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(response, indent=2, ensure_ascii=False),
-                )
-            ]
+    issue_key = arguments.get("issue_key")
+    target_dir = arguments.get("target_dir")
 
-        elif name == "jira_get_sprints_from_board" and ctx and ctx.jira:
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
+    # Download the attachments
+    result = await run_blocking(
+        ctx.jira.download_issue_attachments, issue_key=issue_key, target_dir=target_dir
+    )
 
-            board_id = arguments.get("board_id")
-            state = arguments.get("state", "active")
-            start_at = int(arguments.get("startAt", 0))
-            limit = min(int(arguments.get("limit", 10)), 50)
+    return [TextContent(type="text", text=format_json(result))]
 
-            sprints = ctx.jira.get_all_sprints_from_board_model(
-                board_id=board_id, state=state, start=start_at, limit=limit
+
+async def handle_jira_get_agile_boards(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get jira agile boards by name, project key, or type."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
+
+    board_name = arguments.get("board_name")
+    project_key = arguments.get("project_key")
+    board_type = arguments.get("board_type")
+    start_at, limit = get_pagination(arguments)
+
+    boards = await run_blocking(
+        ctx.jira.get_all_agile_boards_model,
+        board_name=board_name,
+        project_key=project_key,
+        board_type=board_type,
+        start=start_at,
+        limit=limit,
+    )
+
+    return [
+        TextContent(
+            type="text",
+            text=format_json(list(map(TO_SIMPLIFIED_DICT, boards))),
+        )
+    ]
+
+
+async def handle_jira_get_board_issues(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get all issues linked to a specific board."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
+
+    check_required_arguments("jira_get_board_issues", arguments)
+
+    board_id = arguments.get("board_id")
+    jql = arguments.get("jql")
+    fields = arguments.get("fields", "*all")
+
+    start_at, limit = get_pagination(arguments)
+    expand = arguments.get("expand", "version")
+
+    search_result = await run_blocking(
+        ctx.jira.get_board_issues,
+        board_id=board_id,
+        jql=jql,
+        fields=fields,
+        start=start_at,
+        limit=limit,
+        expand=expand,
+    )
+
+    return [TextContent(type="text", text=format_search_result(search_result))]
+
+
+async def handle_jira_get_sprints_from_board(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get jira sprints from board by state."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
+
+    board_id = arguments.get("board_id")
+    state = arguments.get("state", "active")
+    start_at, limit = get_pagination(arguments)
+
+    sprints = await run_blocking(
+        ctx.jira.get_all_sprints_from_board_model,
+        board_id=board_id,
+        state=state,
+        start=start_at,
+        limit=limit,
+    )
+
+    return [
+        TextContent(
+            type="text",
+            text=format_json(list(map(TO_SIMPLIFIED_DICT, sprints))),
+        )
+    ]
+
+
+async def handle_jira_get_sprint_issues(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Get jira issues from sprint."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
+
+    check_required_arguments("jira_get_sprint_issues", arguments)
+
+    sprint_id = arguments.get("sprint_id")
+    fields = arguments.get("fields", "*all")
+    start_at, limit = get_pagination(arguments)
+
+    search_result = await run_blocking(
+        ctx.jira.get_sprint_issues,
+        sprint_id=sprint_id,
+        fields=fields,
+        start=start_at,
+        limit=limit,
+    )
+
+    return [TextContent(type="text", text=format_search_result(search_result))]
+
+
+async def handle_jira_create_issue(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Create a new Jira issue with optional Epic link or parent for subtasks."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
+
+    # Write operation - check read-only mode
+    if ctx.read_only:
+        return [
+            TextContent(
+                type="text",
+                text="Operation 'jira_create_issue' is not available in read-only mode.",
             )
+        ]
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(
-                        [sprint.to_simplified_dict() for sprint in sprints],
-                        indent=2,
-                        ensure_ascii=False,
-                    ),
-                )
-            ]
-
-        elif name == "jira_get_sprint_issues" and ctx and ctx.jira:
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
-
-            sprint_id = arguments.get("sprint_id")
-            fields = arguments.get("fields", "*all")
-            start_at = int(arguments.get("startAt", 0))
-            limit = min(int(arguments.get("limit", 10)), 50)
-
-            search_result = ctx.jira.get_sprint_issues(
-                sprint_id=sprint_id,
-                fields=fields,
-                start=start_at,
-                limit=limit,
+    check_required_arguments("jira_create_issue", arguments)
+
+    # Extract required arguments
+    project_key = arguments.get("project_key")
+    summary = arguments.get("summary")
+    issue_type = arguments.get("issue_type")
+
+    # Extract optional arguments
+    description = arguments.get("description", "")
+    assignee = arguments.get("assignee")
+    components = arguments.get("components")
+
+    # Parse components from comma-separated string to list
+    if components and isinstance(components, str):
+        # Split by comma and strip whitespace, removing empty entries
+        components = [name for comp in components.split(",") if (name := comp.strip())]
+
+    # Parse additional fields
+    raw_additional_fields = arguments.get("additional_fields")
+    additional_fields = {}
+    if raw_additional_fields:
+        try:
+            additional_fields = parse_json(raw_additional_fields)
+        except json.JSONDecodeError as e:
+            raise ValueError("Invalid JSON in additional_fields") from e
+
+    # Create the issue
+    issue = await run_blocking(
+        ctx.jira.create_issue,
+        project_key=project_key,
+        summary=summary,
+        issue_type=issue_type,
+        description=description,
+        assignee=assignee,
+        components=components,
+        **additional_fields,
+    )
+
+    result = issue.to_simplified_dict()
+
+    return [
+        TextContent(
+            type="text",
+            text=f"Issue created successfully:\n{format_json(result)}",
+        )
+    ]
+
+
+async def handle_jira_update_issue(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Update an existing Jira issue including changing status, adding Epic links, updating fields, etc."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
+
+    # Write operation - check read-only mode
+    if ctx.read_only:
+        return [
+            TextContent(
+                type="text",
+                text="Operation 'jira_update_issue' is not available in read-only mode.",
             )
+        ]
 
-            # Format results
-            issues = [issue.to_simplified_dict() for issue in search_result.issues]
+    check_required_arguments("jira_update_issue", arguments)
 
-            # Include metadata in the response
-            response = {
-                "total": search_result.total,
-                "start_at": search_result.start_at,
-                "max_results": search_result.max_results,
-                "issues": issues,
-            }
+    # Extract arguments
+    issue_key = arguments.get("issue_key")
+    raw_fields = arguments.get("fields")
+    raw_additional_fields = arguments.get("additional_fields")
+    raw_attachments = arguments.get("attachments")
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(response, indent=2, ensure_ascii=False),
-                )
-            ]
+    # Parse fields JSON
+    fields = {}
+    if raw_fields:
+        try:
+            fields = parse_json(raw_fields)
+        except json.JSONDecodeError as e:
+            raise ValueError("Invalid JSON in fields") from e
 
-        elif name == "jira_create_issue":
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
+    # Parse additional fields JSON
+    additional_fields = {}
+    if raw_additional_fields:
+        try:
+            additional_fields = parse_json(raw_additional_fields)
+        except json.JSONDecodeError as e:
+            raise ValueError("Invalid JSON in additional_fields") from e
 
-            # Write operation - check read-only mode
-            if read_only:
-                return [
-                    TextContent(
-                        "Operation 'jira_create_issue' is not available in read-only mode."
-                    )
-                ]
+    # Handle attachments if provided
+    # Keep only the paths that exist, checking them off the event loop
+    attachments = parse_attachments(raw_attachments)
+    if attachments:
+        attachments = await run_blocking(filter_existing_paths, attachments)
 
-            # Extract required arguments
-            project_key = arguments.get("project_key")
-            summary = arguments.get("summary")
-            issue_type = arguments.get("issue_type")
-
-            # Extract optional arguments
-            description = arguments.get("description", "")
-            assignee = arguments.get("assignee")
-            components = arguments.get("components")
-
-            # Parse components from comma-separated string to list
-            if components and isinstance(components, str):
-                # Split by comma and strip whitespace, removing empty entries
-                components = [
-                    comp.strip() for comp in components.split(",") if comp.strip()
-                ]
+    try:
+        # Add attachments to additional_fields if any valid paths were found
+        if attachments:
+            additional_fields["attachments"] = attachments
+
+        # Update the issue - directly pass fields to JiraFetcher.update_issue
+        # instead of using fields as a parameter name
+        issue = await run_blocking(
+            ctx.jira.update_issue, issue_key=issue_key, **fields, **additional_fields
+        )
+
+        result = issue.to_simplified_dict()
 
-            # Parse additional fields
-            additional_fields = {}
-            if arguments.get("additional_fields"):
-                try:
-                    additional_fields = json.loads(arguments.get("additional_fields"))
-                except json.JSONDecodeError:
-                    raise ValueError("Invalid JSON in additional_fields")
-
-            # Create the issue
-            issue = ctx.jira.create_issue(
-                project_key=project_key,
-                summary=summary,
-                issue_type=issue_type,
-                description=description,
-                assignee=assignee,
-                components=components,
-                **additional_fields,
+        # Include attachment results if available
+        if (
+            hasattr(issue, "custom_fields")
+            and "attachment_results" in issue.custom_fields
+        ):
+            result["attachment_results"] = issue.custom_fields["attachment_results"]
+
+        return [
+            TextContent(
+                type="text",
+                text=f"Issue updated successfully:\n{format_json(result)}",
+            )
+        ]
+    except Exception as e:
+        return [
+            TextContent(
+                type="text",
+                text=f"Error updating issue {issue_key}: {str(e)}",
             )
+        ]
+
+
+async def handle_jira_delete_issue(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Delete an existing Jira issue."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
+
+    # Write operation - check read-only mode
+    if ctx.read_only:
+        return [
+            TextContent(
+                type="text",
+                text="Operation 'jira_delete_issue' is not available in read-only mode.",
+            )
+        ]
 
-            result = issue.to_simplified_dict()
+    check_required_arguments("jira_delete_issue", arguments)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Issue created successfully:\n{json.dumps(result, indent=2, ensure_ascii=False)}",
-                )
-            ]
+    issue_key = arguments.get("issue_key")
 
-        elif name == "jira_update_issue":
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
+    # Delete the issue
+    deleted = await run_blocking(ctx.jira.delete_issue, issue_key)
 
-            # Write operation - check read-only mode
-            if read_only:
-                return [
-                    TextContent(
-                        "Operation 'jira_update_issue' is not available in read-only mode."
-                    )
-                ]
+    result = {"message": f"Issue {issue_key} has been deleted successfully."}
 
-            # Extract arguments
-            issue_key = arguments.get("issue_key")
-
-            # Parse fields JSON
-            fields = {}
-            if arguments.get("fields"):
-                try:
-                    fields = json.loads(arguments.get("fields"))
-                except json.JSONDecodeError:
-                    raise ValueError("Invalid JSON in fields")
-
-            # Parse additional fields JSON
-            additional_fields = {}
-            if arguments.get("additional_fields"):
-                try:
-                    additional_fields = json.loads(arguments.get("additional_fields"))
-                except json.JSONDecodeError:
-                    raise ValueError("Invalid JSON in additional_fields")
-
-            # Handle attachments if provided
-            attachments = []
-            if arguments.get("attachments"):
-                # Parse attachments - can be a single string or a list of strings
-                if isinstance(arguments.get("attachments"), str):
-                    try:
-                        # Try to parse as JSON array
-                        parsed_attachments = json.loads(arguments.get("attachments"))
-                        if isinstance(parsed_attachments, list):
-                            attachments = parsed_attachments
-                        else:
-                            # Single file path as a JSON string
-                            attachments = [parsed_attachments]
-                    except json.JSONDecodeError:
-                        # Handle non-JSON string formats
-                        if "," in arguments.get("attachments"):
-                            # Split by comma and strip whitespace (supporting comma-separated list format)
-                            attachments = [
-                                path.strip()
-                                for path in arguments.get("attachments").split(",")
-                            ]
-                        else:
-                            # Plain string - single file path
-                            attachments = [arguments.get("attachments")]
-                elif isinstance(arguments.get("attachments"), list):
-                    # Already a list
-                    attachments = arguments.get("attachments")
-
-                # Validate all paths exist
-                for path in attachments[:]:
-                    if not os.path.exists(path):
-                        logger.warning(f"Attachment file not found: {path}")
-                        attachments.remove(path)
-
-            try:
-                # Add attachments to additional_fields if any valid paths were found
-                if attachments:
-                    additional_fields["attachments"] = attachments
-
-                # Update the issue - directly pass fields to JiraFetcher.update_issue
-                # instead of using fields as a parameter name
-                issue = ctx.jira.update_issue(
-                    issue_key=issue_key, **fields, **additional_fields
-                )
+    return [TextContent(type="text", text=format_json(result))]
 
-                result = issue.to_simplified_dict()
-
-                # Include attachment results if available
-                if (
-                    hasattr(issue, "custom_fields")
-                    and "attachment_results" in issue.custom_fields
-                ):
-                    result["attachment_results"] = issue.custom_fields[
-                        "attachment_results"
-                    ]
-
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Issue updated successfully:\n{json.dumps(result, indent=2, ensure_ascii=False)}",
-                    )
-                ]
-            except Exception as e:
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Error updating issue {issue_key}: {str(e)}",
-                    )
-                ]
 
-        elif name == "jira_delete_issue":
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
+async def handle_jira_add_comment(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Add a comment to a Jira issue."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
 
-            # Write operation - check read-only mode
-            if read_only:
-                return [
-                    TextContent(
-                        "Operation 'jira_delete_issue' is not available in read-only mode."
-                    )
-                ]
+    # Write operation - check read-only mode
+    if ctx.read_only:
+        return [
+            TextContent(
+                type="text",
+                text="Operation 'jira_add_comment' is not available in read-only mode.",
+            )
+        ]
 
-            issue_key = arguments.get("issue_key")
+    check_required_arguments("jira_add_comment", arguments)
 
-            # Delete the issue
-            deleted = ctx.jira.delete_issue(issue_key)
+    issue_key = arguments.get("issue_key")
+    comment = arguments.get("comment")
 
-            result = {"message": f"Issue {issue_key} has been deleted successfully."}
+    # Add the comment
+    result = await run_blocking(ctx.jira.add_comment, issue_key, comment)
 
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
+    return [TextContent(type="text", text=format_json(result))]
 
-        elif name == "jira_add_comment":
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
 
-            # Write operation - check read-only mode
-            if read_only:
-                return [
-                    TextContent(
-                        "Operation 'jira_add_comment' is not available in read-only mode."
-                    )
-                ]
+async def handle_jira_add_worklog(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Add a worklog entry to a Jira issue."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
 
-            issue_key = arguments.get("issue_key")
-            comment = arguments.get("comment")
+    # Write operation - check read-only mode
+    if ctx.read_only:
+        return [
+            TextContent(
+                type="text",
+                text="Operation 'jira_add_worklog' is not available in read-only mode.",
+            )
+        ]
+
+    check_required_arguments("jira_add_worklog", arguments)
+
+    # Extract arguments
+    issue_key = arguments.get("issue_key")
+    time_spent = arguments.get("time_spent")
+    comment = arguments.get("comment")
+    started = arguments.get("started")
+
+    # Add the worklog
+    worklog = await run_blocking(
+        ctx.jira.add_worklog,
+        issue_key=issue_key,
+        time_spent=time_spent,
+        comment=comment,
+        started=started,
+    )
+
+    result = {"message": "Worklog added successfully", "worklog": worklog}
+
+    return [
+        TextContent(
+            type="text",
+            text=format_json(result),
+        )
+    ]
+
+
+async def handle_jira_link_to_epic(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Link an existing issue to an epic."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
+
+    # Write operation - check read-only mode
+    if ctx.read_only:
+        return [
+            TextContent(
+                type="text",
+                text="Operation 'jira_link_to_epic' is not available in read-only mode.",
+            )
+        ]
 
-            # Add the comment
-            result = ctx.jira.add_comment(issue_key, comment)
+    check_required_arguments("jira_link_to_epic", arguments)
 
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
+    issue_key = arguments.get("issue_key")
+    epic_key = arguments.get("epic_key")
 
-        elif name == "jira_add_worklog":
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
+    # Link the issue to the epic
+    issue = await run_blocking(ctx.jira.link_issue_to_epic, issue_key, epic_key)
 
-            # Write operation - check read-only mode
-            if read_only:
-                return [
-                    TextContent(
-                        "Operation 'jira_add_worklog' is not available in read-only mode."
-                    )
-                ]
+    result = {
+        "message": f"Issue {issue_key} has been linked to epic {epic_key}.",
+        "issue": issue.to_simplified_dict(),
+    }
 
-            # Extract arguments
-            issue_key = arguments.get("issue_key")
-            time_spent = arguments.get("time_spent")
-            comment = arguments.get("comment")
-            started = arguments.get("started")
-
-            # Add the worklog
-            worklog = ctx.jira.add_worklog(
-                issue_key=issue_key,
-                time_spent=time_spent,
-                comment=comment,
-                started=started,
-            )
+    return [TextContent(type="text", text=format_json(result))]
 
-            result = {"message": "Worklog added successfully", "worklog": worklog}
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2, ensure_ascii=False),
-                )
-            ]
+async def handle_jira_transition_issue(
+    ctx: AppContext | None, arguments: dict[str, Any]
+) -> Sequence[TextContent]:
+    """Transition a Jira issue to a new status."""
+    if not ctx or not ctx.jira:
+        raise ValueError("Jira is not configured.")
 
-        elif name == "jira_link_to_epic":
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
+    # Write operation - check read-only mode
+    if ctx.read_only:
+        return [
+            TextContent(
+                type="text",
+                text="Operation 'jira_transition_issue' is not available in read-only mode.",
+            )
+        ]
 
-            # Write operation - check read-only mode
-            if read_only:
-                return [
-                    TextContent(
-                        "Operation 'jira_link_to_epic' is not available in read-only mode."
-                    )
-                ]
+    check_required_arguments("jira_transition_issue", arguments)
 
-            issue_key = arguments.get("issue_key")
-            epic_key = arguments.get("epic_key")
+    # Extract arguments
+    issue_key = arguments.get("issue_key")
+    transition_id = arguments.get("transition_id")
+    comment = arguments.get("comment")
 
-            # Link the issue to the epic
-            issue = ctx.jira.link_issue_to_epic(issue_key, epic_key)
+    # Convert transition_id to integer if it's a numeric string
+    # This ensures compatibility with the Jira API which expects integers
+    if isinstance(transition_id, str) and transition_id.isdigit():
+        transition_id = int(transition_id)
+        logger.debug(f"Converted string transition_id to integer: {transition_id}")
 
-            result = {
-                "message": f"Issue {issue_key} has been linked to epic {epic_key}.",
-                "issue": issue.to_simplified_dict(),
-            }
+    # Parse fields JSON
+    raw_fields = arguments.get("fields")
+    fields = {}
+    if raw_fields:
+        try:
+            fields = parse_json(raw_fields)
+        except json.JSONDecodeError as e:
+            raise ValueError("Invalid JSON in fields") from e
 
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
+    try:
+        # Transition the issue
+        issue = await run_blocking(
+            ctx.jira.transition_issue,
+            issue_key=issue_key,
+            transition_id=transition_id,
+            fields=fields,
+            comment=comment,
+        )
 
-        elif name == "jira_transition_issue":
-            if not ctx or not ctx.jira:
-                raise ValueError("Jira is not configured.")
+        result = {
+            "message": f"Issue {issue_key} transitioned successfully",
+            "issue": issue.to_simplified_dict() if issue else None,
+        }
 
-            # Write operation - check read-only mode
-            if read_only:
-                return [
-                    TextContent(
-                        "Operation 'jira_transition_issue' is not available in read-only mode."
-                    )
-                ]
+        return [
+            TextContent(
+                type="text",
+                text=format_json(result),
+            )
+        ]
+    except Exception as e:
+        # Provide a clear error message, especially for transition ID type issues
+        error_msg = str(e)
+        if "'transition' identifier must be an integer" in error_msg:
+            error_msg = (
+                f"Error transitioning issue {issue_key}: The Jira API requires transition IDs to be integers. "
+                f"Received transition ID '{transition_id}' of type {type(transition_id).__name__}. "
+                f"Please use the numeric ID value from jira_get_transitions."
+            )
+        else:
+            error_msg = f"Error transitioning issue {issue_key} with transition ID {transition_id}: {error_msg}"
 
-            # Extract arguments
-            issue_key = arguments.get("issue_key")
-            transition_id = arguments.get("transition_id")
-            comment = arguments.get("comment")
-
-            # Validate required parameters
-            if not issue_key:
-                raise ValueError("issue_key is required")
-            if not transition_id:
-                raise ValueError("transition_id is required")
-
-            # Convert transition_id to integer if it's a numeric string
-            # This ensures compatibility with the Jira API which expects integers
-            if isinstance(transition_id, str) and transition_id.isdigit():
-                transition_id = int(transition_id)
-                logger.debug(
-                    f"Converted string transition_id to integer: {transition_id}"
-                )
+        logger.error(error_msg)
+        return [
+            TextContent(
+                type="text",
+                text=error_msg,
+            )
+        ]
+
+
+TOOL_HANDLERS: dict[str, ToolHandler] = {
+    "confluence_search": handle_confluence_search,
+    "confluence_get_page": handle_confluence_get_page,
+    "confluence_get_pages": handle_confluence_get_pages,
+    "confluence_get_page_children": handle_confluence_get_page_children,
+    "confluence_get_page_ancestors": handle_confluence_get_page_ancestors,
+    "confluence_get_comments": handle_confluence_get_comments,
+    "confluence_create_page": handle_confluence_create_page,
+    "confluence_update_page": handle_confluence_update_page,
+    "confluence_delete_page": handle_confluence_delete_page,
+    "confluence_attach_content": handle_confluence_attach_content,
+    "jira_get_issue": handle_jira_get_issue,
+    "jira_search": handle_jira_search,
+    "jira_get_project_issues": handle_jira_get_project_issues,
+    "jira_get_epic_issues": handle_jira_get_epic_issues,
+    "jira_get_transitions": handle_jira_get_transitions,
+    "jira_get_worklog": handle_jira_get_worklog,
+    "jira_download_attachments": handle_jira_download_attachments,
+    "jira_get_agile_boards": handle_jira_get_agile_boards,
+    "jira_get_board_issues": handle_jira_get_board_issues,
+    "jira_get_sprints_from_board": handle_jira_get_sprints_from_board,
+    "jira_get_sprint_issues": handle_jira_get_sprint_issues,
+    "jira_create_issue": handle_jira_create_issue,
+    "jira_update_issue": handle_jira_update_issue,
+    "jira_delete_issue": handle_jira_delete_issue,
+    "jira_add_comment": handle_jira_add_comment,
+    "jira_add_worklog": handle_jira_add_worklog,
+    "jira_link_to_epic": handle_jira_link_to_epic,
+    "jira_transition_issue": handle_jira_transition_issue,
+}
 
-            # Parse fields JSON
-            fields = {}
-            if arguments.get("fields"):
-                try:
-                    fields = json.loads(arguments.get("fields"))
-                except json.JSONDecodeError:
-                    raise ValueError("Invalid JSON in fields")
-
-            try:
-                # Transition the issue
-                issue = ctx.jira.transition_issue(
-                    issue_key=issue_key,
-                    transition_id=transition_id,
-                    fields=fields,
-                    comment=comment,
-                )
 
-                result = {
-                    "message": f"Issue {issue_key} transitioned successfully",
-                    "issue": issue.to_simplified_dict() if issue else None,
-                }
+@app.call_tool()
+async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
+    """Handle tool calls for Confluence and Jira operations."""
+    ctx = app.request_context.lifespan_context
 
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2, ensure_ascii=False),
-                    )
-                ]
-            except Exception as e:
-                # Provide a clear error message, especially for transition ID type issues
-                error_msg = str(e)
-                if "'transition' identifier must be an integer" in error_msg:
-                    error_msg = (
-                        f"Error transitioning issue {issue_key}: The Jira API requires transition IDs to be integers. "
-                        f"Received transition ID '{transition_id}' of type {type(transition_id).__name__}. "
-                        f"Please use the numeric ID value from jira_get_transitions."
-                    )
-                else:
-                    error_msg = f"Error transitioning issue {issue_key} with transition ID {transition_id}: {error_msg}"
-
-                logger.error(error_msg)
-                return [
-                    TextContent(
-                        type="text",
-                        text=error_msg,
-                    )
-                ]
+    try:
+        handler = TOOL_HANDLERS.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
 
-        raise ValueError(f"Unknown tool: {name}")
+        return await handler(ctx, arguments)
 
     except Exception as e:
-        logger.error(f"Tool execution error: {str(e)}")
+        # Tracebacks are only worth formatting when debugging
+        logger.error(
+            f"Tool execution error: {str(e)}",
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
@@ -3,12 +3,16 @@ Utility functions for the MCP Atlassian integration.
 This package provides various utility functions used throughout the codebase.
 """
 
-# Re-export from ssl module
+# Re-export from http module
+from .http import configure_connection_pool
+
 # Re-export from io module
 from .io import is_read_only_mode
 
 # Export new logging utilities
 from .logging import setup_logging
+
+# Re-export from ssl module
 from .ssl import SSLIgnoreAdapter, configure_ssl_verification
 
 # Re-export from urls module
@@ -17,6 +21,7 @@ from .urls import is_atlassian_cloud_url
 # Export all utility functions for backward compatibility
 __all__ = [
     "SSLIgnoreAdapter",
+    "configure_connection_pool",
     "configure_ssl_verification",
     "is_atlassian_cloud_url",
     "is_read_only_mode",
@@ -0,0 +1,47 @@
+"""HTTP session utility functions for MCP Atlassian."""
+
+from requests.adapters import HTTPAdapter
+from requests.sessions import Session
+from urllib3.util.retry import Retry
+
+# Connections kept per host, sized for concurrent MCP tool calls
+HTTP_POOL_SIZE = 32
+
+# Transient responses worth retrying before surfacing an error
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def build_retry_policy() -> Retry:
+    """Build the retry policy shared by every adapter mounted on a session.
+
+    Returns:
+        A Retry that backs off on transient responses without raising on them
+    """
+    return Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False,
+    )
+
+
+def configure_connection_pool(
+    session: Session, pool_size: int = HTTP_POOL_SIZE
+) -> None:
+    """Size the connection pool of a service session.
+
+    The requests default of 10 pooled connections per host makes concurrent
+    tool calls wait on each other, and reconnect once the pool overflows.
+    Idempotent requests that hit a transient error are retried with backoff.
+
+    Args:
+        session: The requests session to configure
+        pool_size: Number of connections to keep per host
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=build_retry_policy(),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
@@ -9,6 +9,8 @@ from requests.adapters import HTTPAdapter
 from requests.sessions import Session
 from urllib3.poolmanager import PoolManager
 
+from .http import HTTP_POOL_SIZE, build_retry_policy
+
 logger = logging.getLogger("mcp-atlassian")
 
 
@@ -92,7 +94,12 @@ def configure_ssl_verification(
         # Get the domain from the configured URL
         domain = urlparse(url).netloc
 
-        # Mount the adapter to handle requests to this domain
-        adapter = SSLIgnoreAdapter()
+        # Mount the adapter to handle requests to this domain. Its prefix is
+        # more specific than the pooled adapter's, so it needs the same retries.
+        adapter = SSLIgnoreAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=build_retry_policy(),
+        )
         session.mount(f"https://{domain}", adapter)
         session.mount(f"http://{domain}", adapter)
@@ -1,9 +1,11 @@
 """URL-related utility functions for MCP Atlassian."""
 
 import re
+from functools import lru_cache
 from urllib.parse import urlparse
 
 
+@lru_cache(maxsize=32)
 def is_atlassian_cloud_url(url: str) -> bool:
     """Determine if a URL belongs to Atlassian Cloud or Server/Data Center.
 
@@ -12,6 +14,10 @@ def is_atlassian_cloud_url(url: str) -> bool:
 
     Returns:
         True if the URL is for an Atlassian Cloud instance, False for Server/Data Center
+
+    Note:
+        Results are memoized since the same configured URLs are checked repeatedly
+        (service detection, config loading and client setup).
     """
     # Localhost and IP-based URLs are always Server/Data Center
     if url is None or not url:
@@ -69,6 +69,17 @@ class TestPagesMixin:
         assert result.attachments[0].id is not None
         assert result.attachments[1].id is not None
 
+    def test_get_page_content_with_ancestors(self, pages_mixin):
+        """Test that ancestors are expanded in the same page request."""
+        # Act
+        pages_mixin.get_page_content("987654321", include_ancestors=True)
+
+        # Assert
+        pages_mixin.confluence.get_page_by_id.assert_called_once_with(
+            page_id="987654321",
+            expand="body.storage,version,space,children.attachment,ancestors",
+        )
+
     def test_get_page_ancestors(self, pages_mixin):
         """Test getting page ancestors (parent pages)."""
         # Arrange
@@ -570,6 +581,38 @@ class TestPagesMixin:
         # Assert - should return empty list on error, not raise exception
         assert len(results) == 0
 
+    def test_get_pages_batches_ids(self, pages_mixin):
+        """Test that get_pages fetches up to 50 pages per content search."""
+        # Arrange
+        page_ids = [str(page_id) for page_id in range(1, 61)]
+        pages_mixin.confluence.get.side_effect = [
+            {"results": [{"id": "1", "title": "First", "space": {"key": "DEMO"}}]},
+            {"results": [{"id": "60", "title": "Last", "space": {"key": "DEMO"}}]},
+        ]
+
+        # Act
+        results = pages_mixin.get_pages(page_ids)
+
+        # Assert
+        assert pages_mixin.confluence.get.call_count == 2
+        first_call, second_call = pages_mixin.confluence.get.call_args_list
+        assert first_call.args == ("rest/api/content/search",)
+        assert first_call.kwargs["params"]["cql"] == (
+            f"id in ({','.join(page_ids[:50])})"
+        )
+        assert first_call.kwargs["params"]["expand"] == "version,space"
+        assert second_call.kwargs["params"]["cql"] == (
+            f"id in ({','.join(page_ids[50:])})"
+        )
+        assert [page.id for page in results] == ["1", "60"]
+
+    def test_get_pages_invalid_id(self, pages_mixin):
+        """Test that non-numeric page IDs are rejected before any request."""
+        with pytest.raises(ValueError, match="Invalid page IDs: 1 OR x"):
+            pages_mixin.get_pages(["123", "1 OR x"])
+
+        pages_mixin.confluence.get.assert_not_called()
+
     def test_get_page_success(self, pages_mixin):
         """Test successful page retrieval."""
         # Setup
@@ -56,7 +56,9 @@ class TestSearchMixin:
         result = search_mixin.search("test query")
 
         # Verify API call
-        search_mixin.confluence.cql.assert_called_once_with(cql="test query", limit=10)
+        search_mixin.confluence.cql.assert_called_once_with(
+            cql="test query", start=0, limit=10
+        )
 
         # Verify result
         assert len(result) == 1
@@ -179,6 +181,7 @@ class TestSearchMixin:
         quoted_dev = quote_cql_identifier_if_needed("DEV")
         search_mixin.confluence.cql.assert_called_with(
             cql=f"(test query) AND (space = {quoted_dev})",
+            start=0,
             limit=10,
         )
         assert len(result) == 1
@@ -191,6 +194,7 @@ class TestSearchMixin:
         quoted_team = quote_cql_identifier_if_needed("TEAM")
         search_mixin.confluence.cql.assert_called_with(
             cql=f"(test query) AND (space = {quoted_dev} OR space = {quoted_team})",
+            start=0,
             limit=10,
         )
         assert len(result) == 1
@@ -199,6 +203,7 @@ class TestSearchMixin:
         result = search_mixin.search('space = "EXISTING"', spaces_filter="DEV")
         search_mixin.confluence.cql.assert_called_with(
             cql='space = "EXISTING"',  # Should not add filter when space already exists
+            start=0,
             limit=10,
         )
         assert len(result) == 1
@@ -239,6 +244,7 @@ class TestSearchMixin:
         quoted_team = quote_cql_identifier_if_needed("TEAM")
         search_mixin.confluence.cql.assert_called_with(
             cql=f"(test query) AND (space = {quoted_dev} OR space = {quoted_team})",
+            start=0,
             limit=10,
         )
         assert len(result) == 1
@@ -250,6 +256,7 @@ class TestSearchMixin:
         quoted_override = quote_cql_identifier_if_needed("OVERRIDE")
         search_mixin.confluence.cql.assert_called_with(
             cql=f"(test query) AND (space = {quoted_override})",
+            start=0,
             limit=10,
         )
         assert len(result) == 1
@@ -6,6 +6,7 @@ import pytest
 
 from mcp_atlassian.jira.config import JiraConfig
 from mcp_atlassian.jira.projects import ProjectsMixin
+from mcp_atlassian.models.jira import JiraSearchResult
 
 
 @pytest.fixture
@@ -428,7 +429,7 @@ def test_get_project_issues_count_exception(projects_mixin):
 def test_get_project_issues_with_search_mixin(projects_mixin):
     """Test get_project_issues method with search_issues available."""
     # Mock the search_issues method
-    mock_search_result = [MagicMock(), MagicMock()]
+    mock_search_result = MagicMock(spec=JiraSearchResult)
     projects_mixin.search_issues = MagicMock(return_value=mock_search_result)
 
     result = projects_mixin.get_project_issues("PROJ1", start=10, limit=20)
@@ -463,9 +464,10 @@ def test_get_project_issues_without_search_mixin(projects_mixin):
     result = projects_mixin.get_project_issues("PROJ1", start=10, limit=20)
 
     # Check the result
-    assert len(result) == 2
-    assert result[0].key == "PROJ1-1"
-    assert result[0].description == "Description 1"
+    assert isinstance(result, JiraSearchResult)
+    assert len(result.issues) == 2
+    assert result.issues[0].key == "PROJ1-1"
+    assert result.issues[0].description == "Description 1"
 
     projects_mixin.jira.jql.assert_called_once_with(
         jql="project = PROJ1", fields="*all", start=10, limit=20
@@ -482,7 +484,8 @@ def test_get_project_issues_invalid_response(projects_mixin):
     projects_mixin.jira.jql.return_value = {}
 
     result = projects_mixin.get_project_issues("PROJ1")
-    assert result == []
+    assert result.issues == []
+    assert result.total == 0
     projects_mixin.jira.jql.assert_called_once()
 
     # Non-dict response
@@ -490,7 +493,8 @@ def test_get_project_issues_invalid_response(projects_mixin):
     projects_mixin.jira.jql.return_value = "not a dict"
 
     result = projects_mixin.get_project_issues("PROJ1")
-    assert result == []
+    assert result.issues == []
+    assert result.total == 0
     projects_mixin.jira.jql.assert_called_once()
 
 
@@ -503,7 +507,8 @@ def test_get_project_issues_exception(projects_mixin):
     projects_mixin.jira.jql.side_effect = Exception("API error")
 
     result = projects_mixin.get_project_issues("PROJ1")
-    assert result == []
+    assert result.issues == []
+    assert result.total == 0
     projects_mixin.jira.jql.assert_called_once()
 
 
@@ -1,6 +1,8 @@
 """Unit tests for server"""
 
+import json
 import os
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
@@ -12,13 +14,25 @@ from mcp.types import Resource, Tool
 
 from mcp_atlassian.confluence import ConfluenceFetcher
 from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.models.confluence import ConfluencePage
+from mcp_atlassian.models.jira import JiraSearchResult
 from mcp_atlassian.server import (
+    CONFLUENCE_ID_PATTERN,
+    CONFLUENCE_READ_TOOLS,
+    CONFLUENCE_WRITE_TOOLS,
+    REQUIRED_ARGUMENTS,
+    TOOL_HANDLERS,
     AppContext,
     call_tool,
+    format_json,
     get_available_services,
+    get_pagination,
     list_resources,
     list_tools,
+    parse_attachments,
+    parse_json,
     read_resource,
+    run_in_threads,
     server_lifespan,
 )
 
@@ -226,8 +240,8 @@ async def test_server_lifespan():
     """Test the server_lifespan context manager."""
     with (
         patch("mcp_atlassian.server.get_available_services") as mock_services,
-        patch("mcp_atlassian.server.ConfluenceFetcher") as mock_confluence_cls,
-        patch("mcp_atlassian.server.JiraFetcher") as mock_jira_cls,
+        patch("mcp_atlassian.confluence.ConfluenceFetcher") as mock_confluence_cls,
+        patch("mcp_atlassian.jira.JiraFetcher") as mock_jira_cls,
         patch("mcp_atlassian.server.is_read_only_mode") as mock_read_only,
         patch("mcp_atlassian.server.logger") as mock_logger,
     ):
@@ -248,6 +262,7 @@ async def test_server_lifespan():
             assert isinstance(ctx, AppContext)
             assert ctx.confluence is not None
             assert ctx.jira is not None
+            assert ctx.read_only is False
 
             # Verify logging calls
             mock_logger.info.assert_any_call("Starting MCP Atlassian server")
@@ -282,6 +297,16 @@ async def test_list_resources_both_services(app_context):
             assert hasattr(res, "mimeType")
             assert hasattr(res, "description")
 
+        descriptions = {str(res.uri): res.description for res in resources}
+        assert descriptions["confluence://TEST"] == (
+            "A Confluence space containing documentation and knowledge base articles. "
+            "Space Key: TEST. Space for testing "
+            "Access content using: confluence://TEST/pages/PAGE_TITLE"
+        )
+        assert descriptions["jira://TEST"] == (
+            "A Jira project tracking issues and tasks. Project Key: TEST."
+        )
+
 
 @pytest.mark.anyio
 async def test_list_resources_only_jira(app_context):
@@ -409,19 +434,21 @@ async def test_list_resources_client_error(app_context):
                     ctx.jira,
                     "search_issues",
                     MagicMock(
-                        return_value=[
-                            MagicMock(
-                                to_simplified_dict=MagicMock(
-                                    return_value={
-                                        "key": "TEST-123",
-                                        "summary": "Test Issue",
-                                        "url": "https://example.atlassian.net/browse/TEST-123",
-                                        "status": {"name": "Open"},
-                                        "description": "This is a test issue",
-                                    }
+                        return_value=MagicMock(
+                            issues=[
+                                MagicMock(
+                                    to_simplified_dict=MagicMock(
+                                        return_value={
+                                            "key": "TEST-123",
+                                            "summary": "Test Issue",
+                                            "url": "https://example.atlassian.net/browse/TEST-123",
+                                            "status": {"name": "Open"},
+                                            "description": "This is a test issue",
+                                        }
+                                    )
                                 )
-                            )
-                        ]
+                            ]
+                        )
                     ),
                 ),  # type: ignore
             ),
@@ -536,17 +563,17 @@ async def test_list_tools_both_services():
     """Test the list_tools handler with both services available."""
     # Create a mock context
     mock_context = AppContext(
-        jira=MagicMock(spec=JiraFetcher), confluence=MagicMock(spec=ConfluenceFetcher)
+        jira=MagicMock(spec=JiraFetcher),
+        confluence=MagicMock(spec=ConfluenceFetcher),
+        read_only=False,
     )
 
     with (
         patch("mcp_atlassian.server.get_available_services") as mock_services,
-        patch("mcp_atlassian.server.is_read_only_mode") as mock_read_only,
         mock_request_context(mock_context),
     ):
         # Configure mocks
         mock_services.return_value = {"confluence": True, "jira": True}
-        mock_read_only.return_value = False
 
         # Call the handler directly
         tools = await list_tools()
@@ -570,17 +597,17 @@ async def test_list_tools_read_only_mode():
     """Test the list_tools handler in read-only mode."""
     # Create a mock context
     mock_context = AppContext(
-        jira=MagicMock(spec=JiraFetcher), confluence=MagicMock(spec=ConfluenceFetcher)
+        jira=MagicMock(spec=JiraFetcher),
+        confluence=MagicMock(spec=ConfluenceFetcher),
+        read_only=True,
     )
 
     with (
         patch("mcp_atlassian.server.get_available_services") as mock_services,
-        patch("mcp_atlassian.server.is_read_only_mode") as mock_read_only,
         mock_request_context(mock_context),
     ):
         # Configure mocks
         mock_services.return_value = {"confluence": True, "jira": True}
-        mock_read_only.return_value = True
 
         # Call the handler directly
         tools = await list_tools()
@@ -666,10 +693,9 @@ async def test_call_tool_success(tool_name, arguments, mock_setup, app_context):
 async def test_call_tool_read_only_mode(app_context):
     """Test the call_tool handler in read-only mode."""
     # Create a custom environment with read-only mode enabled
-    with (
-        patch("mcp_atlassian.server.is_read_only_mode", return_value=True),
-        mock_request_context(app_context),
-    ):
+    app_context.read_only = True
+
+    with mock_request_context(app_context):
         # Try calling a tool that would normally be write-only
         # We can't predict exactly what error message will be returned,
         # but we can check that a result is returned (even if it's an error)
@@ -707,8 +733,8 @@ async def test_call_tool_invalid_arguments(app_context):
             {},  # Missing required 'jql' argument
         )
 
-        # Just verify we got a result
-        assert isinstance(result, list)
+        assert result[0].text == "Error: Missing required parameters: jql"
+        app_context.jira.search_issues.assert_not_called()
 
 
 @pytest.mark.anyio
@@ -722,10 +748,9 @@ async def test_call_tool_jira_create_issue_with_components(app_context):
     }
     app_context.jira.create_issue.return_value = mock_issue
 
-    with (
-        patch("mcp_atlassian.server.is_read_only_mode", return_value=False),
-        mock_request_context(app_context),
-    ):
+    app_context.read_only = False
+
+    with mock_request_context(app_context):
         # Call the tool with components parameter
         result = await call_tool(
             "jira_create_issue",
@@ -767,3 +792,540 @@ async def test_call_tool_jira_create_issue_with_components(app_context):
         app_context.jira.create_issue.assert_called_once()
         call_kwargs = app_context.jira.create_issue.call_args[1]
         assert call_kwargs["components"] is None
+
+
+@pytest.mark.anyio
+async def test_call_tool_jira_update_issue_skips_missing_attachments(
+    app_context, tmp_path
+):
+    """Test that attachment paths that do not exist are dropped."""
+    existing = tmp_path / "report.txt"
+    existing.write_text("report")
+    missing = str(tmp_path / "missing.txt")
+    attachments = [str(existing), missing]
+
+    mock_issue = MagicMock()
+    mock_issue.to_simplified_dict.return_value = {"key": "TEST-123"}
+    mock_issue.custom_fields = {}
+    app_context.jira.update_issue.return_value = mock_issue
+
+    with mock_request_context(app_context):
+        await call_tool(
+            "jira_update_issue",
+            {"issue_key": "TEST-123", "fields": "{}", "attachments": attachments},
+        )
+
+    app_context.jira.update_issue.assert_called_once_with(
+        issue_key="TEST-123", attachments=[str(existing)]
+    )
+    # The caller's argument list is left untouched
+    assert attachments == [str(existing), missing]
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (None, []),
+        ("", []),
+        (["/tmp/a.txt", "/tmp/b.txt"], ["/tmp/a.txt", "/tmp/b.txt"]),
+        ('["/tmp/a.txt", "/tmp/b.txt"]', ["/tmp/a.txt", "/tmp/b.txt"]),
+        ('"/tmp/a.txt"', ["/tmp/a.txt"]),
+        ("/tmp/a.txt, /tmp/b.txt", ["/tmp/a.txt", "/tmp/b.txt"]),
+        ("/tmp/a.txt,, /tmp/b.txt,", ["/tmp/a.txt", "/tmp/b.txt"]),
+        ("/tmp/a.txt", ["/tmp/a.txt"]),
+        (42, []),
+    ],
+)
+def test_parse_attachments(value, expected):
+    """Test the accepted formats of the attachments argument."""
+    assert parse_attachments(value) == expected
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "query,expected_cql",
+    [
+        ("project documentation", 'text ~ "project documentation"'),
+        ("type=page AND space=DEV", "type=page AND space=DEV"),
+        ('title~"Meeting Notes"', 'title~"Meeting Notes"'),
+        ("contributor = currentUser()", "contributor = currentUser()"),
+    ],
+)
+async def test_call_tool_confluence_search_cql_detection(
+    query, expected_cql, app_context
+):
+    """Test that only simple search terms are converted to CQL text searches."""
+    app_context.confluence.search.return_value = []
+
+    with mock_request_context(app_context):
+        await call_tool("confluence_search", {"query": query})
+
+    app_context.confluence.search.assert_called_once_with(
+        expected_cql, limit=10, spaces_filter=None, start=0
+    )
+
+
+@pytest.mark.anyio
+async def test_call_tool_confluence_search_start(app_context):
+    """Test that confluence_search pages through results from the given start."""
+    app_context.confluence.search.return_value = []
+
+    with mock_request_context(app_context):
+        await call_tool(
+            "confluence_search", {"query": "type=page", "limit": 10, "start": 20}
+        )
+
+    app_context.confluence.search.assert_called_once_with(
+        "type=page", limit=10, spaces_filter=None, start=20
+    )
+
+
+@pytest.mark.anyio
+async def test_tool_handlers_cover_listed_tools(app_context):
+    """Test that every listed tool has a unique name and a handler."""
+    app_context.read_only = False
+
+    with mock_request_context(app_context):
+        tools = await list_tools()
+
+    # A duplicated name would silently shadow a tool in the lookup tables
+    assert len(tools) == len(TOOL_HANDLERS)
+    assert {tool.name for tool in tools} == set(TOOL_HANDLERS)
+    assert set(REQUIRED_ARGUMENTS) == set(TOOL_HANDLERS)
+
+
+@pytest.mark.anyio
+async def test_call_tool_missing_required_arguments(app_context):
+    """Test that every missing required argument is reported before the call."""
+    with mock_request_context(app_context):
+        result = await call_tool("confluence_attach_content", {"page_id": "123"})
+
+    assert result[0].text == "Error: Missing required parameters: content, name"
+    app_context.confluence.attach_content.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_call_tool_accepts_empty_required_argument(app_context):
+    """Test that an empty string is a valid value for a required argument."""
+    app_context.confluence.create_page.return_value = MagicMock(
+        to_simplified_dict=MagicMock(return_value={"id": "123"})
+    )
+
+    with mock_request_context(app_context):
+        result = await call_tool(
+            "confluence_create_page",
+            {"space_key": "TEST", "title": "Empty Page", "content": ""},
+        )
+
+    assert result[0].text.startswith("Page created successfully")
+    app_context.confluence.create_page.assert_called_once_with(
+        space_key="TEST",
+        title="Empty Page",
+        body="",
+        parent_id=None,
+        is_markdown=True,
+    )
+
+
+@pytest.mark.anyio
+async def test_call_tool_read_only_mode_before_missing_arguments(app_context):
+    """Test that read-only mode is reported even when arguments are missing."""
+    app_context.read_only = True
+
+    with mock_request_context(app_context):
+        result = await call_tool("jira_delete_issue", {})
+
+    assert result[0].text == (
+        "Operation 'jira_delete_issue' is not available in read-only mode."
+    )
+
+
+@pytest.mark.anyio
+async def test_call_tool_not_configured_before_missing_arguments(app_context):
+    """Test that an unconfigured service is reported before missing arguments."""
+    app_context.confluence = None
+
+    with mock_request_context(app_context):
+        result = await call_tool("confluence_get_page", {})
+
+    assert result[0].text == "Error: Confluence is not configured."
+
+
+@pytest.mark.anyio
+async def test_call_tool_read_only_mode_message(app_context):
+    """Test that write tools report that they are unavailable in read-only mode."""
+    app_context.read_only = True
+
+    with mock_request_context(app_context):
+        result = await call_tool("jira_delete_issue", {"issue_key": "TEST-123"})
+
+    assert result[0].text == (
+        "Operation 'jira_delete_issue' is not available in read-only mode."
+    )
+    app_context.jira.delete_issue.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_list_tools_reuses_tool_definitions(app_context):
+    """Test that list_tools returns the prebuilt Tool objects on every call."""
+    with mock_request_context(app_context):
+        first = await list_tools()
+        second = await list_tools()
+
+    assert len(first) == len(second)
+    assert all(a is b for a, b in zip(first, second, strict=True))
+
+
+def test_confluence_page_id_inputs_are_numeric():
+    """Test that every Confluence page_id and parent_id input only accepts digits."""
+    id_inputs = {
+        (tool.name, name): schema
+        for tool in (*CONFLUENCE_READ_TOOLS, *CONFLUENCE_WRITE_TOOLS)
+        for name, schema in tool.inputSchema["properties"].items()
+        if name in ("page_id", "parent_id")
+    }
+
+    assert len(id_inputs) == 8
+    assert all(
+        schema.get("pattern") == CONFLUENCE_ID_PATTERN for schema in id_inputs.values()
+    )
+
+
+@pytest.mark.anyio
+async def test_run_in_threads_preserves_order():
+    """Test that run_in_threads returns results in the order of the calls."""
+    results = await run_in_threads(lambda: "first", lambda: "second", lambda: "third")
+
+    assert results == ["first", "second", "third"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("as_models", [True, False])
+async def test_call_tool_confluence_get_comments(app_context, as_models):
+    """Test that comment models and raw comment dicts are both formatted."""
+    raw_comment = {
+        "id": "1",
+        "author": {"displayName": "Test User"},
+        "created": "2024-01-01",
+        "body": "Looks good",
+    }
+    simplified = {"id": "1", "author": "Test User", "body": "Looks good"}
+    if as_models:
+        comment = MagicMock()
+        comment.to_simplified_dict.return_value = simplified
+        app_context.confluence.get_page_comments.return_value = [comment]
+    else:
+        app_context.confluence.get_page_comments.return_value = [raw_comment]
+
+    with mock_request_context(app_context):
+        result = await call_tool("confluence_get_comments", {"page_id": "123"})
+
+    expected = (
+        simplified
+        if as_models
+        else {
+            "id": "1",
+            "author": "Test User",
+            "created": "2024-01-01",
+            "body": "Looks good",
+        }
+    )
+    assert json.loads(result[0].text) == [expected]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("include_metadata", [True, False])
+async def test_call_tool_confluence_get_page_with_ancestors(
+    app_context, include_metadata
+):
+    """Test that confluence_get_page returns ancestors once, at the top level."""
+    page = ConfluencePage.from_api_response(
+        {
+            "id": "123",
+            "title": "Test Page",
+            "space": {"key": "TEST"},
+            "ancestors": [{"id": "1", "title": "Root", "type": "page"}],
+        },
+        base_url="https://example.atlassian.net/wiki",
+        content_override="Page content",
+        content_format="markdown",
+    )
+    app_context.confluence.get_page_content.return_value = page
+    app_context.confluence.config.url = "https://example.atlassian.net/wiki"
+
+    with mock_request_context(app_context):
+        result = await call_tool(
+            "confluence_get_page",
+            {
+                "page_id": "123",
+                "include_ancestors": True,
+                "include_metadata": include_metadata,
+            },
+        )
+
+    app_context.confluence.get_page_content.assert_called_once_with(
+        "123", convert_to_markdown=True, include_ancestors=True
+    )
+    response = json.loads(result[0].text)
+    if include_metadata:
+        assert response["metadata"]["id"] == "123"
+        assert "ancestors" not in response["metadata"]
+    else:
+        assert response["content"] == "Page content"
+    assert [ancestor["id"] for ancestor in response["ancestors"]] == ["1"]
+    assert response["ancestors"][0]["title"] == "Root"
+
+
+@pytest.mark.anyio
+async def test_call_tool_confluence_get_pages(app_context):
+    """Test that confluence_get_pages fetches pages at once and lists missing IDs."""
+    page = MagicMock(id="123")
+    page.to_simplified_dict.return_value = {"id": "123", "title": "Test Page"}
+    app_context.confluence.get_pages.return_value = [page]
+
+    with mock_request_context(app_context):
+        result = await call_tool(
+            "confluence_get_pages",
+            {
+                "page_ids": ["123", "456"],
+                "include_content": True,
+                "convert_to_markdown": False,
+            },
+        )
+
+    app_context.confluence.get_pages.assert_called_once_with(
+        ["123", "456"],
+        expand="version,space,body.storage",
+        convert_to_markdown=False,
+    )
+    assert json.loads(result[0].text) == {
+        "total": 1,
+        "results": [{"id": "123", "title": "Test Page"}],
+        "not_found": ["456"],
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "page_ids, message",
+    [
+        ("123456", "page_ids must be a list of page IDs"),
+        (
+            [str(page_id) for page_id in range(51)],
+            "At most 50 page IDs can be requested at once",
+        ),
+    ],
+)
+async def test_call_tool_confluence_get_pages_invalid_ids(
+    app_context, page_ids, message
+):
+    """Test that confluence_get_pages rejects a bare string or too many IDs."""
+    with mock_request_context(app_context):
+        result = await call_tool("confluence_get_pages", {"page_ids": page_ids})
+
+    assert result[0].text == f"Error: {message}"
+    app_context.confluence.get_pages.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_call_tool_runs_fetcher_in_worker_thread(app_context):
+    """Test that blocking fetcher calls do not run on the event loop thread."""
+    loop_thread = threading.get_ident()
+    call_threads = []
+
+    def get_page_ancestors(page_id):
+        call_threads.append(threading.get_ident())
+        return []
+
+    app_context.confluence.get_page_ancestors = get_page_ancestors
+
+    with mock_request_context(app_context):
+        await call_tool("confluence_get_page_ancestors", {"page_id": "123"})
+
+    assert call_threads and call_threads[0] != loop_thread
+
+
+@pytest.mark.anyio
+async def test_list_resources_paginates_jira_projects(app_context):
+    """Test that Jira project discovery fetches every page reported by the total."""
+    app_context.confluence = None
+
+    def jql_page(jql, start=0, limit=None, fields=None):
+        project_key = "TEST" if start < 100 else "OTHER"
+        return {
+            "total": 120,
+            "issues": [
+                {"fields": {"project": {"key": project_key, "name": project_key}}}
+            ],
+        }
+
+    app_context.jira.jira.jql.side_effect = jql_page
+
+    with mock_request_context(app_context):
+        resources = await list_resources()
+
+    starts = sorted(
+        call.kwargs["start"] for call in app_context.jira.jira.jql.mock_calls
+    )
+    assert starts == [0, 50, 100]
+    assert [str(resource.uri) for resource in resources] == [
+        "jira://TEST",
+        "jira://OTHER",
+    ]
+
+
+def test_format_json_is_compact():
+    """Test that tool results are serialized without extra whitespace."""
+    pytest.importorskip("orjson")
+    assert format_json({"key": "TEST-1", "labels": ["ü", "b"]}) == (
+        '{"key":"TEST-1","labels":["ü","b"]}'
+    )
+
+
+def test_format_json_without_orjson(monkeypatch):
+    """Test that the standard library encoder produces the same output."""
+    monkeypatch.setattr("mcp_atlassian.server.orjson", None)
+    assert format_json({"key": "TEST-1", "labels": ["ü", "b"]}) == (
+        '{"key":"TEST-1","labels":["ü","b"]}'
+    )
+
+
+@pytest.mark.parametrize(
+    "arguments,expected",
+    [
+        ({}, (0, 10)),
+        ({"startAt": "20", "limit": "5"}, (20, 5)),
+        ({"limit": 500}, (0, 50)),
+        ({"startAt": -3, "limit": 0}, (0, 1)),
+    ],
+)
+def test_get_pagination(arguments, expected):
+    """Test that paging arguments are converted and kept within bounds."""
+    assert get_pagination(arguments) == expected
+
+
+def test_parse_json():
+    """Test that orjson parses arguments and raises JSONDecodeError."""
+    pytest.importorskip("orjson")
+    assert parse_json('{"priority": {"name": "High"}}') == {
+        "priority": {"name": "High"}
+    }
+    with pytest.raises(json.JSONDecodeError):
+        parse_json("{not json")
+
+
+def test_parse_json_without_orjson(monkeypatch):
+    """Test that the standard library decoder is used when orjson is missing."""
+    monkeypatch.setattr("mcp_atlassian.server.orjson", None)
+    assert parse_json('{"priority": {"name": "High"}}') == {
+        "priority": {"name": "High"}
+    }
+    with pytest.raises(json.JSONDecodeError):
+        parse_json("{not json")
+
+
+@pytest.mark.anyio
+async def test_read_resource_jira_project_escapes_jql(app_context):
+    """Test that the project key and account ID are quoted in the project JQL."""
+    app_context.jira.get_current_user_account_id = MagicMock(return_value='acc"1')
+    app_context.jira.search_issues = MagicMock(
+        return_value=MagicMock(
+            issues=[
+                MagicMock(
+                    to_simplified_dict=MagicMock(
+                        return_value={
+                            "key": "TEST-1",
+                            "summary": "First",
+                            "url": "https://example.atlassian.net/browse/TEST-1",
+                            "status": {"name": "Open"},
+                        }
+                    )
+                )
+            ]
+        )
+    )
+
+    with mock_request_context(app_context):
+        content = await read_resource("jira://TEST")
+
+    app_context.jira.search_issues.assert_called_once_with(
+        jql='project = "TEST" AND (assignee = "acc\\"1" OR reporter = "acc\\"1") '
+        "ORDER BY updated DESC",
+        limit=20,
+    )
+    assert content.startswith(
+        "# [TEST-1: First](https://example.atlassian.net/browse/TEST-1)"
+    )
+
+
+@pytest.mark.anyio
+async def test_read_resource_jira_project_falls_back_to_project_issues(app_context):
+    """Test that recent project issues are listed when the user has none."""
+    app_context.jira.get_current_user_account_id = MagicMock(return_value="acc1")
+    app_context.jira.search_issues = MagicMock(
+        return_value=JiraSearchResult.from_api_response({"issues": [], "total": 0})
+    )
+    app_context.jira.get_project_issues = MagicMock(
+        return_value=JiraSearchResult.from_api_response(
+            {
+                "issues": [
+                    {
+                        "key": "TEST-2",
+                        "fields": {
+                            "summary": "Recent",
+                            "status": {"name": "Done"},
+                        },
+                    }
+                ],
+                "total": 1,
+            }
+        )
+    )
+
+    with mock_request_context(app_context):
+        content = await read_resource("jira://TEST")
+
+    app_context.jira.get_project_issues.assert_called_once_with("TEST", limit=10)
+    assert content.startswith("# [TEST-2: Recent]")
+    assert "Status: Done" in content
+
+
+@pytest.mark.anyio
+async def test_read_resource_confluence_page_title_with_slash(app_context):
+    """Test that everything after /pages/ is used as the page title."""
+    app_context.confluence.get_page_by_title = MagicMock(
+        return_value=MagicMock(page_content="Test page content")
+    )
+
+    with mock_request_context(app_context):
+        result = await read_resource("confluence://TEST/pages/Q1/Q2 Plan")
+
+    assert result == "Test page content"
+    app_context.confluence.get_page_by_title.assert_called_once_with(
+        "TEST", "Q1/Q2 Plan"
+    )
+
+
+@pytest.mark.anyio
+async def test_read_resource_jira_issue_markdown(app_context):
+    """Test the markdown rendered for a specific Jira issue resource."""
+    app_context.jira.get_issue = MagicMock(
+        return_value=MagicMock(
+            to_simplified_dict=MagicMock(
+                return_value={
+                    "key": "TEST-123",
+                    "summary": "Test Issue",
+                    "status": {"name": "Open"},
+                    "description": "This is a test issue",
+                }
+            )
+        )
+    )
+
+    with mock_request_context(app_context):
+        content = await read_resource("jira://TEST/TEST-123")
+
+    app_context.jira.get_issue.assert_called_once_with("TEST-123")
+    assert content == (
+        "# TEST-123: Test Issue\n\n**Status:** Open\n\nThis is a test issue\n\n"
+    )
@@ -0,0 +1,63 @@
+"""Tests for the HTTP session utilities module."""
+
+from requests.sessions import Session
+
+from mcp_atlassian.utils.http import (
+    HTTP_POOL_SIZE,
+    RETRY_STATUS_CODES,
+    configure_connection_pool,
+)
+from mcp_atlassian.utils.ssl import SSLIgnoreAdapter, configure_ssl_verification
+
+
+def test_configure_connection_pool():
+    """Test that the session adapters are sized and retry transient errors."""
+    # Arrange
+    session = Session()
+
+    # Act
+    configure_connection_pool(session)
+
+    # Assert
+    for prefix in ("https://", "http://"):
+        adapter = session.get_adapter(f"{prefix}example.atlassian.net")
+        assert adapter._pool_connections == HTTP_POOL_SIZE
+        assert adapter._pool_maxsize == HTTP_POOL_SIZE
+        assert adapter.max_retries.total == 3
+        assert set(adapter.max_retries.status_forcelist) == set(RETRY_STATUS_CODES)
+
+
+def test_configure_connection_pool_custom_size():
+    """Test that a custom pool size is applied."""
+    # Arrange
+    session = Session()
+
+    # Act
+    configure_connection_pool(session, pool_size=4)
+
+    # Assert
+    adapter = session.get_adapter("https://example.atlassian.net")
+    assert adapter._pool_maxsize == 4
+
+
+def test_configure_connection_pool_with_ssl_verification_disabled():
+    """Test that the per-domain SSL adapter keeps the pool size and retries."""
+    # Arrange
+    session = Session()
+    configure_connection_pool(session)
+
+    # Act
+    configure_ssl_verification(
+        service_name="Test",
+        url="https://jira.example.com",
+        session=session,
+        ssl_verify=False,
+    )
+
+    # Assert
+    for prefix in ("https://", "http://"):
+        adapter = session.get_adapter(f"{prefix}jira.example.com/rest/api/2/myself")
+        assert isinstance(adapter, SSLIgnoreAdapter)
+        assert adapter._pool_maxsize == HTTP_POOL_SIZE
+        assert adapter.max_retries.total == 3
+        assert set(adapter.max_retries.status_forcelist) == set(RETRY_STATUS_CODES)
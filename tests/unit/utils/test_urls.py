@@ -57,3 +57,11 @@ def test_is_atlassian_cloud_url_with_protocols():
     assert (
         is_atlassian_cloud_url("ftp://example.atlassian.net") is True
     )  # URL parsing still works
+
+
+def test_is_atlassian_cloud_url_is_memoized():
+    """Test that repeated checks of the same URL are served from the cache."""
+    is_atlassian_cloud_url.cache_clear()
+    assert is_atlassian_cloud_url("https://example.atlassian.net") is True
+    assert is_atlassian_cloud_url("https://example.atlassian.net") is True
+    assert is_atlassian_cloud_url.cache_info().hits == 1